@@ -28,8 +28,12 @@ CLASSIFIERS = [
     'Programming Language :: Python :: 3.4',
 ]
 INSTALL_REQUIRES = ['jinja2', 'seaborn', 'wqio']
+EXTRAS_REQUIRE = {
+    'cache': ['pyarrow'],
+}
 PACKAGE_DATA = {
     'wqreports.testing': ['*.txt'],
+    'wqreports.core': ['*.png'],
 }
 DATA_FILES = None
 
@@ -50,5 +54,6 @@ if __name__ == "__main__":
         platforms=PLATFORMS,
         classifiers=CLASSIFIERS,
         install_requires=INSTALL_REQUIRES,
+        extras_require=EXTRAS_REQUIRE,
         zip_safe=False
     )
@@ -1 +1,2 @@
 from .pdfreport import PdfReport, make_table
+from .service import ReportService, UnknownGroup, serve
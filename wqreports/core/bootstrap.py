@@ -0,0 +1,260 @@
+import hashlib
+
+import numpy as np
+import scipy.stats as stats
+
+
+# largest number of resampled values drawn at once, which bounds the
+# memory of the bootstrap of large groups (8 MB of indices)
+RESAMPLE_CHUNK = 2 ** 20
+
+
+def group_rng(seed, key):
+    """ Independent random stream for a group of data.
+
+    The stream depends only on ``seed`` and ``key``, so the resamples
+    of a group do not change with the order in which the groups are
+    processed or with how they are split between workers.
+
+    Parameters
+    ----------
+    seed : int
+        Seed of the whole run.
+    key : tuple
+        Identifier of the group, e.g. (geolocation, analyte).
+
+    Returns
+    -------
+    rng : numpy.random.RandomState
+
+    """
+    token = repr((int(seed),) + tuple(str(k) for k in key)).encode('utf-8')
+    digest = hashlib.sha256(token).digest()
+    return np.random.RandomState(np.frombuffer(digest, dtype=np.uint32))
+
+
+def _resample(data, statfxn, niter, rng):
+    """ Evaluates ``statfxn`` on ``niter`` resamples of ``data``.
+
+    The resamples are drawn in chunks of iterations, which gives the
+    same values as drawing them all at once.
+    """
+    N = data.shape[0]
+    chunk = max(1, RESAMPLE_CHUNK // max(N, 1))
+    boot_stats = np.empty(niter, dtype=np.float64)
+    for start in range(0, niter, chunk):
+        stop = min(start + chunk, niter)
+        index = rng.randint(0, N, size=(stop - start, N))
+        boot_stats[start:stop] = statfxn(data[index], axis=1)
+    return boot_stats
+
+
+def _jackknife(data, statfxn):
+    """ ``statfxn`` of ``data`` without each of its values in turn.
+
+    The means and medians are computed in closed form rather than
+    from ``N`` copies of the data.
+    """
+    N = data.shape[0]
+    if N > 1 and statfxn is np.mean:
+        return (data.sum() - data) / (N - 1)
+
+    if N > 1 and statfxn is np.median:
+        order = np.argsort(data, kind='mergesort')
+        ranked = data[order]
+        ranks = np.empty(N, dtype=int)
+        ranks[order] = np.arange(N)
+
+        def remaining(position):
+            # value at ``position`` of the sorted data without value i
+            return np.where(position < ranks, ranked[position], ranked[position + 1])
+
+        return (remaining((N - 2) // 2) + remaining((N - 1) // 2)) / 2.0
+
+    return np.array([statfxn(np.delete(data, i)) for i in range(N)])
+
+
+def _acceleration(data, statfxn):
+    """ Jackknife estimate of the BCA acceleration constant.
+    """
+    jack = _jackknife(data, statfxn)
+    deltas = jack.mean() - jack
+    denom = 6.0 * np.sum(deltas**2) ** 1.5
+    if denom == 0:
+        return 0.0
+    return np.sum(deltas**3) / denom
+
+
+def _bca_bounds(boot_stats, primary, accel, alpha):
+    """ Bias-corrected and accelerated interval from the bootstrapped
+    statistics.
+    """
+    niter = boot_stats.shape[0]
+    frac = np.clip(np.mean(boot_stats < primary), 1.0 / (niter + 1), niter / (niter + 1.0))
+    z0 = stats.norm.ppf(frac)
+    z = stats.norm.ppf([alpha / 2.0, 1 - alpha / 2.0])
+    pctls = stats.norm.cdf(z0 + (z0 + z) / (1 - accel * (z0 + z)))
+    return np.percentile(boot_stats, pctls * 100)
+
+
+def BCA(data, statfxn, niter=5000, rng=None, alpha=0.05):
+    """ Bias-corrected and accelerated (BCA) bootstrap confidence
+    interval with a fixed number of iterations.
+
+    Parameters
+    ----------
+    data : array-like
+        1-D array of the values to be resampled.
+    statfxn : callable
+        Function that computes the statistic. Must accept an ``axis``
+        keyword argument (e.g., ``np.mean``, ``np.median``).
+    niter : int (default = 5000)
+        Number of bootstrap iterations.
+    rng : numpy.random.RandomState, optional
+        Source of the random resamples. If omitted, numpy's global
+        random state is used.
+    alpha : float (default = 0.05)
+        Significance level of the interval.
+
+    Returns
+    -------
+    CI : numpy array
+        Lower and upper bounds of the confidence interval.
+
+    """
+    if rng is None:
+        rng = np.random
+
+    data = np.asarray(data, dtype=np.float64)
+    primary = statfxn(data)
+    accel = _acceleration(data, statfxn)
+    boot_stats = _resample(data, statfxn, niter, rng)
+    return _bca_bounds(boot_stats, primary, accel, alpha)
+
+
+def adaptive_BCA(data, statfxn, tol=0.01, block=500, maxiter=5000,
+                 rng=None, alpha=0.05):
+    """ BCA bootstrap confidence interval that resamples in blocks and
+    stops once the bounds have stabilized.
+
+    After each block of ``block`` iterations the interval is
+    recomputed from all resamples so far. Resampling stops when
+    neither bound moved by more than ``tol`` times the width of the
+    interval, or when ``maxiter`` iterations have been used.
+
+    Parameters
+    ----------
+    data : array-like
+        1-D array of the values to be resampled.
+    statfxn : callable
+        Function that computes the statistic. Must accept an ``axis``
+        keyword argument (e.g., ``np.mean``, ``np.median``).
+    tol : float (default = 0.01)
+        Largest change of either bound between two consecutive blocks,
+        relative to the width of the interval, that is considered
+        stable.
+    block : int (default = 500)
+        Number of iterations in each block.
+    maxiter : int (default = 5000)
+        Hard upper limit on the number of bootstrap iterations.
+    rng : numpy.random.RandomState, optional
+        Source of the random resamples. If omitted, numpy's global
+        random state is used.
+    alpha : float (default = 0.05)
+        Significance level of the interval.
+
+    Returns
+    -------
+    CI : numpy array
+        Lower and upper bounds of the confidence interval.
+    niter : int
+        Number of bootstrap iterations actually used.
+
+    """
+    if block < 1:
+        raise ValueError('`block` must be a positive number of iterations, not {}'.format(block))
+    if tol < 0:
+        raise ValueError('`tol` must not be negative, not {}'.format(tol))
+
+    if rng is None:
+        rng = np.random
+
+    data = np.asarray(data, dtype=np.float64)
+    primary = statfxn(data)
+    accel = _acceleration(data, statfxn)
+
+    boot_stats = np.empty(0, dtype=np.float64)
+    previous = None
+    CI = None
+    while boot_stats.shape[0] < maxiter:
+        n = min(block, maxiter - boot_stats.shape[0])
+        boot_stats = np.hstack([boot_stats, _resample(data, statfxn, n, rng)])
+        CI = _bca_bounds(boot_stats, primary, accel, alpha)
+        if previous is not None:
+            width = CI[1] - CI[0]
+            change = np.max(np.abs(CI - previous))
+            if change <= tol * width or width == 0:
+                break
+        previous = CI
+
+    return CI, boot_stats.shape[0]
+
+
+def conf_intervals(data, bsIter=5000, tol=None, block=500, rng=None,
+                   stats=('mean', 'median', 'logmean')):
+    """ Bootstrapped confidence intervals of the mean, median,
+    log-mean, and geometric mean of a dataset.
+
+    Parameters
+    ----------
+    data : array-like
+        1-D array of the values to be summarized.
+    bsIter : int (default = 5000)
+        Number of bootstrap iterations. When ``tol`` is provided, this
+        is the upper limit of the adaptive bootstrap instead.
+    tol : float, optional
+        When provided, the intervals are computed with
+        ``adaptive_BCA`` using this tolerance.
+    block : int (default = 500)
+        Number of iterations per block of the adaptive bootstrap.
+    rng : numpy.random.RandomState, optional
+        Source of the random resamples. If omitted, numpy's global
+        random state is used.
+    stats : sequence of str, optional
+        Statistics to bootstrap, among 'mean', 'median', and 'logmean'
+        (which also gives the 'geomean'). Defaults to all of them.
+
+    Returns
+    -------
+    intervals : dict
+        Confidence intervals of ``stats`` keyed by 'mean', 'median',
+        'logmean', and 'geomean'. The log-scale intervals are ``None``
+        when the data are not strictly positive.
+    iterations : dict
+        Number of bootstrap iterations used for each of ``stats``.
+
+    """
+    data = np.asarray(data, dtype=np.float64)
+
+    def _interval(values, statfxn):
+        if tol is None:
+            return BCA(values, statfxn, niter=bsIter, rng=rng), bsIter
+        return adaptive_BCA(values, statfxn, tol=tol, block=block,
+                            maxiter=bsIter, rng=rng)
+
+    intervals = {}
+    iterations = {}
+    if 'mean' in stats:
+        intervals['mean'], iterations['mean'] = _interval(data, np.mean)
+    if 'median' in stats:
+        intervals['median'], iterations['median'] = _interval(data, np.median)
+    if 'logmean' in stats:
+        if np.all(data > 0):
+            intervals['logmean'], iterations['logmean'] = _interval(np.log(data), np.mean)
+            intervals['geomean'] = np.exp(intervals['logmean'])
+        else:
+            intervals['logmean'] = None
+            intervals['geomean'] = None
+            iterations['logmean'] = 0
+
+    return intervals, iterations
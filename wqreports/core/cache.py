@@ -0,0 +1,177 @@
+import os
+import glob
+import json
+import hashlib
+import warnings
+
+try:
+    from pyarrow import feather
+except ImportError:
+    feather = None
+
+
+CACHE_VERSION = 3
+_BLOCKSIZE = 2**20
+
+
+def default_folder(path):
+    """ Default cache folder of a data file: ".wqreports_cache" next
+    to the file.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(path)), '.wqreports_cache')
+
+
+def _stamp_file(folder, path):
+    return os.path.join(folder, '{}.stamp.json'.format(os.path.basename(path)))
+
+
+def _content_digest(path, stat, folder=None):
+    """ SHA1 hex digest of the content of a file.
+
+    With a cache folder, the digest is kept in a stamp file in the
+    folder and only computed again when the size or the modification
+    time of the file change, so that opening a cached file does not
+    read all of it.
+    """
+    stamp = {
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+    }
+    if folder is not None:
+        stampfile = _stamp_file(folder, path)
+        try:
+            with open(stampfile, 'r', encoding='utf-8') as previous:
+                previous = json.load(previous)
+        except (IOError, OSError, ValueError):
+            previous = {}
+        if all(previous.get(k) == v for k, v in stamp.items()) and 'digest' in previous:
+            return previous['digest']
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as data:
+        for block in iter(lambda: data.read(_BLOCKSIZE), b''):
+            digest.update(block)
+    stamp['digest'] = digest.hexdigest()
+
+    if folder is not None:
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        tmpfile = stampfile + '.tmp'
+        with open(tmpfile, 'w', encoding='utf-8') as current:
+            json.dump(stamp, current)
+        os.replace(tmpfile, stampfile)
+
+    return stamp['digest']
+
+
+def cache_key(path, config, folder=None):
+    """ Key of the cached data of a file.
+
+    Parameters
+    ----------
+    path : str
+        Filepath of the source data.
+    config : dict
+        JSON-serializable options that determine how the source data
+        are parsed and cleaned (e.g., column names, ndvals).
+    folder : str, optional
+        Folder of the cache. When provided, the digest of the file's
+        content is stored in it and reused for as long as the size
+        and modification time of the file do not change.
+
+    Returns
+    -------
+    key : str
+        Hex digest of the file's size, modification time and content,
+        and of ``config``.
+
+    """
+    stat = os.stat(path)
+    key = hashlib.sha1()
+    key.update(json.dumps({
+        'version': CACHE_VERSION,
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'content': _content_digest(path, stat, folder),
+        'config': config,
+    }, sort_keys=True).encode('utf-8'))
+    return key.hexdigest()
+
+
+def _cache_file(folder, path, key):
+    return os.path.join(folder, '{}.{}.feather'.format(os.path.basename(path), key))
+
+
+def load(folder, path, key):
+    """ Opens the cached data of a file.
+
+    Parameters
+    ----------
+    folder : str
+        Folder of the cache.
+    path : str
+        Filepath of the source data.
+    key : str
+        Key of the data as returned by ``cache_key``.
+
+    Returns
+    -------
+    data : pandas.DataFrame or None
+        The cached data, or None if the data are not in the cache (or
+        pyarrow is missing). The numeric columns without missing
+        values and the codes of the categorical columns are views of
+        the memory-mapped cache file rather than copies.
+
+    """
+    cachefile = _cache_file(folder, path, key)
+    if feather is None or not os.path.exists(cachefile):
+        return None
+
+    table = feather.read_table(cachefile, memory_map=True)
+    # one block per column, so that the columns are not consolidated
+    # (i.e., copied) into 2-D blocks
+    return table.to_pandas(split_blocks=True)
+
+
+def store(folder, path, key, data, categories=None):
+    """ Writes the cleaned data of a file to the cache, replacing any
+    older cached version of that file.
+
+    Parameters
+    ----------
+    folder : str
+        Folder of the cache. It is created if it does not exist.
+    path : str
+        Filepath of the source data.
+    key : str
+        Key of the data as returned by ``cache_key``.
+    data : pandas.DataFrame
+        The cleaned data.
+    categories : list of str, optional
+        Columns stored as categoricals (i.e., integer codes).
+
+    """
+    if feather is None:
+        warnings.warn('pyarrow is not installed, the data will not be cached')
+        return
+
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+    if categories is not None:
+        data = data.astype({col: 'category' for col in categories})
+
+    cachefile = _cache_file(folder, path, key)
+    pattern = os.path.join(glob.escape(folder),
+                           glob.escape(os.path.basename(path)) + '.*.feather')
+    for stale in glob.glob(pattern):
+        if stale != cachefile:
+            os.remove(stale)
+
+    # uncompressed and in a single chunk, so that the columns can be
+    # read straight from the memory-mapped file
+    tmpfile = cachefile + '.tmp'
+    feather.write_feather(data.reset_index(drop=True), tmpfile,
+                          compression='uncompressed', chunksize=max(data.shape[0], 1))
+    os.replace(tmpfile, cachefile)
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+
+
+def _group_order(data, columns):
+    """ Codes and labels of each column, and the order of the rows
+    sorted by all of the columns.
+    """
+    codes = []
+    labels = {}
+    for col in columns:
+        col_codes, labels[col] = pd.factorize(data[col], sort=True)
+        codes.append(col_codes)
+
+    # np.lexsort sorts by the last key first
+    order = np.lexsort(codes[::-1])
+    return codes, labels, order
+
+
+def _is_identity(order):
+    return np.array_equal(order, np.arange(order.shape[0]))
+
+
+def sort_groups(data, columns):
+    """ Sorts the rows of a dataset as a GroupIndex does.
+
+    Data stored in this order (e.g., in the ingest cache) are indexed
+    without being copied.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The data to be grouped.
+    columns : list of str
+        All of the columns used to group the data, as passed to
+        GroupIndex.
+
+    Returns
+    -------
+    sorted : pandas.DataFrame
+        The sorted data, or ``data`` itself when it is already sorted.
+
+    """
+    order = _group_order(data, columns)[2]
+    if _is_identity(order):
+        return data
+    return data.iloc[order]
+
+
+class GroupIndex(object):
+    """ Index of the groups of a dataset for several groupings at once.
+
+    Each column is factorized once and the rows are sorted once by all
+    of the columns. The groups of any combination of columns that make
+    up a leading subset of ``columns`` (in any order) are then
+    contiguous slices of the sorted data, i.e. views that are not
+    copied. Groups of other combinations reuse the same codes and are
+    looked up by position. Data that are already sorted (see
+    ``sort_groups``) are used as they are.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The data to be grouped.
+    columns : list of str
+        All of the columns used to group the data, the most commonly
+        used ones first.
+
+    """
+
+    def __init__(self, data, columns):
+        self.columns = list(columns)
+
+        codes, self.labels, order = _group_order(data, self.columns)
+        if _is_identity(order):
+            self.data = data
+            self.codes = dict(zip(self.columns, codes))
+        else:
+            self.data = data.iloc[order]
+            self.codes = {col: col_codes[order] for col, col_codes in zip(self.columns, codes)}
+        self._groups = {}
+
+    def _combined_codes(self, columns):
+        """ Single integer code of each row for a combination of columns.
+        Rows with a missing value in any of the columns get -1.
+        """
+        codes = [self.codes[col] for col in columns]
+        missing = np.any([c < 0 for c in codes], axis=0)
+        shape = [max(len(self.labels[col]), 1) for col in columns]
+        combined = np.ravel_multi_index([np.where(missing, 0, c) for c in codes], shape)
+        return np.where(missing, -1, combined)
+
+    def _key(self, columns, position):
+        key = []
+        for col in columns:
+            value = self.labels[col][self.codes[col][position]]
+            # plain python values, e.g. for json
+            if isinstance(value, np.generic):
+                value = value.item()
+            key.append(value)
+        return tuple(key)
+
+    def groups(self, columns):
+        """ Rows of each group of a combination of columns.
+
+        Parameters
+        ----------
+        columns : list of str
+            Columns that define the groups. Each must be one of
+            ``self.columns``.
+
+        Returns
+        -------
+        groups : dict
+            Rows of each group of ``self.data``, keyed by the tuple of
+            the group's values in ``columns``. The rows are a slice
+            when the group is contiguous, an array of positions
+            otherwise. Rows with missing values are left out, as in
+            pandas.DataFrame.groupby.
+
+        """
+        columns = tuple(columns)
+        if columns not in self._groups:
+            self._groups[columns] = self._find_groups(columns)
+        return self._groups[columns]
+
+    def _find_groups(self, columns):
+        unknown = set(columns) - set(self.columns)
+        if unknown:
+            raise ValueError('{} are not in the group index'.format(sorted(unknown)))
+
+        N = self.data.shape[0]
+        contiguous = set(columns) == set(self.columns[:len(columns)])
+        if contiguous:
+            # codes of the leading columns are already sorted
+            combined = self._combined_codes(self.columns[:len(columns)])
+            order = None
+        else:
+            combined = self._combined_codes(columns)
+            order = np.argsort(combined, kind='mergesort')
+            combined = combined[order]
+
+        bounds = np.flatnonzero(np.diff(combined)) + 1
+        starts = np.hstack([0, bounds]).astype(int)
+        stops = np.hstack([bounds, N]).astype(int)
+
+        groups = {}
+        for start, stop in zip(starts, stops):
+            if stop <= start or combined[start] < 0:
+                continue
+            if order is None:
+                groups[self._key(columns, start)] = slice(start, stop)
+            else:
+                groups[self._key(columns, order[start])] = order[start:stop]
+        return groups
+
+    def frame(self, rows):
+        """ The data of a group, as returned by ``groups``.
+        """
+        return self.data.iloc[rows]
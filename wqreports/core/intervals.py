@@ -0,0 +1,190 @@
+import numpy as np
+import scipy.stats as stats
+
+from . import bootstrap
+
+
+# statistics of the report table -> available methods, the default first
+METHODS = {
+    'mean': ('bootstrap', 't'),
+    'median': ('bootstrap', 'binomial'),
+    'geomean': ('bootstrap', 'lognormal'),
+}
+
+# closed-form method of each statistic
+ANALYTIC = {
+    'mean': 't',
+    'median': 'binomial',
+    'geomean': 'lognormal',
+}
+
+LABELS = {
+    'bootstrap': 'BCA bootstrap',
+    't': 't-interval',
+    'binomial': 'order statistics',
+    'lognormal': 'lognormal t-interval',
+}
+
+
+def t_interval(data, alpha=0.05):
+    """ Student's t confidence interval of the mean.
+
+    Parameters
+    ----------
+    data : array-like
+        1-D array of at least two values.
+    alpha : float (default = 0.05)
+        Significance level of the interval.
+
+    Returns
+    -------
+    CI : numpy array
+        Lower and upper bounds of the confidence interval.
+
+    """
+    data = np.asarray(data, dtype=np.float64)
+    N = data.shape[0]
+    halfwidth = stats.t.ppf(1 - alpha / 2.0, N - 1) * data.std(ddof=1) / np.sqrt(N)
+    return np.array([data.mean() - halfwidth, data.mean() + halfwidth])
+
+
+def binomial_interval(data, alpha=0.05):
+    """ Distribution-free confidence interval of the median from the
+    order statistics of the data.
+
+    The bounds are the j-th smallest and j-th largest values, where j
+    is the largest rank such that the binomial(N, 0.5) probability of
+    fewer than j values falling below the median is at most alpha / 2.
+    With too few values for the requested confidence, the bounds fall
+    back to the minimum and maximum.
+
+    Parameters
+    ----------
+    data : array-like
+        1-D array of the values.
+    alpha : float (default = 0.05)
+        Significance level of the interval.
+
+    Returns
+    -------
+    CI : numpy array
+        Lower and upper bounds of the confidence interval.
+
+    """
+    data = np.sort(np.asarray(data, dtype=np.float64))
+    N = data.shape[0]
+    j = int(stats.binom.ppf(alpha / 2.0, N, 0.5))
+    j = max(j, 1)
+    return np.array([data[j - 1], data[N - j]])
+
+
+def lognormal_interval(data, alpha=0.05):
+    """ Confidence intervals of the log-mean and the geometric mean,
+    assuming the data are lognormally distributed.
+
+    Parameters
+    ----------
+    data : array-like
+        1-D array of strictly positive values.
+    alpha : float (default = 0.05)
+        Significance level of the interval.
+
+    Returns
+    -------
+    logmean_CI, geomean_CI : numpy arrays
+        Lower and upper bounds of the confidence intervals.
+
+    """
+    logmean_CI = t_interval(np.log(data), alpha=alpha)
+    return logmean_CI, np.exp(logmean_CI)
+
+
+def resolve_methods(methods=None):
+    """ Validates the confidence interval method of each statistic.
+
+    Parameters
+    ----------
+    methods : str or dict, optional
+        Either 'bootstrap' or 'analytic' for all of the statistics, or
+        a dictionary of the method of some of 'mean', 'median', and
+        'geomean' (see ``METHODS``). 'analytic' is accepted in the
+        dictionary as well. Omitted statistics are bootstrapped.
+
+    Returns
+    -------
+    methods : dict
+        Method of each of 'mean', 'median', and 'geomean'.
+
+    """
+    if methods is None:
+        methods = {}
+    elif not isinstance(methods, dict):
+        methods = {stat: methods for stat in METHODS}
+
+    unknown = set(methods) - set(METHODS)
+    if unknown:
+        raise ValueError('No confidence intervals for {}'.format(sorted(unknown)))
+
+    resolved = {}
+    for stat, available in METHODS.items():
+        method = methods.get(stat, available[0])
+        if method == 'analytic':
+            method = ANALYTIC[stat]
+        if method not in available:
+            raise ValueError('{} is not a method for the {}: use one of {}'
+                             .format(method, stat, available))
+        resolved[stat] = method
+    return resolved
+
+
+def conf_intervals(data, methods=None, bsIter=5000, tol=None, block=500,
+                   rng=None, alpha=0.05):
+    """ Confidence intervals of the mean, median, log-mean, and
+    geometric mean of a dataset, each with its own method.
+
+    Parameters
+    ----------
+    data : array-like
+        1-D array of the values to be summarized.
+    methods : str or dict, optional
+        Method of each statistic, see ``resolve_methods``. The
+        log-mean always uses the method of the geometric mean.
+    bsIter, tol, block, rng : optional
+        Options of the bootstrapped intervals, passed directly to
+        ``bootstrap.conf_intervals``.
+    alpha : float (default = 0.05)
+        Significance level of the analytic intervals.
+
+    Returns
+    -------
+    intervals : dict
+        Confidence intervals keyed by 'mean', 'median', 'logmean', and
+        'geomean'. The log-scale intervals are ``None`` when the data
+        are not strictly positive.
+    iterations : dict
+        Number of bootstrap iterations used for 'mean', 'median', and
+        'logmean'; 0 for the analytic intervals.
+
+    """
+    data = np.asarray(data, dtype=np.float64)
+    methods = resolve_methods(methods)
+
+    bootstrapped = [
+        {'geomean': 'logmean'}.get(stat, stat)
+        for stat, method in methods.items() if method == 'bootstrap'
+    ]
+    intervals, iterations = bootstrap.conf_intervals(
+        data, bsIter=bsIter, tol=tol, block=block, rng=rng, stats=bootstrapped)
+
+    if methods['mean'] == 't':
+        intervals['mean'], iterations['mean'] = t_interval(data, alpha=alpha), 0
+    if methods['median'] == 'binomial':
+        intervals['median'], iterations['median'] = binomial_interval(data, alpha=alpha), 0
+    if methods['geomean'] == 'lognormal':
+        if np.all(data > 0):
+            intervals['logmean'], intervals['geomean'] = lognormal_interval(data, alpha=alpha)
+        else:
+            intervals['logmean'], intervals['geomean'] = None, None
+        iterations['logmean'] = 0
+
+    return intervals, iterations
@@ -0,0 +1,109 @@
+import os
+import json
+import threading
+
+
+class Journal(object):
+    """ Append-only record of the reports produced by a batch run.
+
+    Each line of the journal file is a JSON object with the key of a
+    group, its output filename, its status ('done', 'failed', or
+    'skipped' for the groups with too few data for a report), and the
+    error message of failed groups. The last line written for a
+    group determines its status, so a journal can be appended to by
+    successive runs.
+
+    Parameters
+    ----------
+    path : str
+        Filepath of the journal. It is created if it does not exist.
+
+    """
+
+    DONE = 'done'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self):
+        """ Dictionary of the latest entry of each group, keyed by the
+        group's key as a tuple.
+        """
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path, 'r', encoding='utf-8') as journal:
+            for line in journal:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a line cut short by an interrupted run
+                    continue
+                entries[tuple(entry['key'])] = entry
+        return entries
+
+    def completed(self):
+        """ Set of the keys of the groups whose report was produced and
+        still exists on disk.
+        """
+        return set(
+            key for key, entry in self.entries.items()
+            if entry['status'] == self.DONE and os.path.exists(entry['filename'])
+        )
+
+    def skipped(self):
+        """ Set of the keys of the groups that have too few data for
+        a report.
+        """
+        return set(
+            key for key, entry in self.entries.items()
+            if entry['status'] == self.SKIPPED
+        )
+
+    def failed(self):
+        """ Dictionary of the error messages of the groups that failed,
+        keyed by the group's key.
+        """
+        return {
+            key: entry['error'] for key, entry in self.entries.items()
+            if entry['status'] == self.FAILED
+        }
+
+    def record(self, key, filename, status, error=None):
+        """ Appends the outcome of a group to the journal.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the group, e.g. (geolocation, analyte).
+        filename : str
+            Output PDF of the group.
+        status : str
+            One of ``Journal.DONE``, ``Journal.FAILED``, and
+            ``Journal.SKIPPED``.
+        error : str, optional
+            Error message of a failed group.
+
+        """
+        entry = {'key': list(key), 'filename': filename, 'status': status,
+                 'error': error}
+        line = (json.dumps(entry) + '\n').encode('utf-8')
+        with self._lock:
+            with open(self.path, 'ab+') as journal:
+                # start on a new line if the previous run was cut short
+                journal.seek(0, os.SEEK_END)
+                if journal.tell() > 0:
+                    journal.seek(-1, os.SEEK_END)
+                    if journal.read(1) != b'\n':
+                        line = b'\n' + line
+                journal.write(line)
+                journal.flush()
+                os.fsync(journal.fileno())
@@ -1,16 +1,23 @@
 import sys
 import os
 import io
-from jinja2 import Environment, FileSystemLoader, FunctionLoader
+from jinja2 import Environment, FunctionLoader
 import urllib
 import base64
 import copy
 import gc
+import multiprocessing
+import threading
+import time
+from contextlib import contextmanager
+from concurrent import futures
 
 import numpy as np
 import pandas as pd
 import matplotlib as mpl
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib import gridspec
 import matplotlib.image as mpimg
 import seaborn as sns
 import scipy.stats as stats
@@ -18,72 +25,403 @@ import scipy.stats as stats
 # pip install https://github.com/Geosyntec/python-pdfkit/archive/master.zip
 import pdfkit
 from ..utils import (html_template, css_template)
+from . import bootstrap
+from . import descriptive
+from . import intervals as ci
+from . import cache as ingest_cache
+from . import scheduler
+from .groups import GroupIndex, sort_groups
+from .journal import Journal
+from .shared import SharedDataset
 import wqio
 
-sns.set(style='ticks', context='paper')
-mpl.rcParams['text.usetex'] = False
-mpl.rcParams['lines.markeredgewidth'] = .5
-mpl.rcParams['font.family'] = ['sans-serif']
-mpl.rcParams['mathtext.default'] = 'regular'
 
+# matplotlib reads its style from the global rcParams, mostly when
+# artists are created, so figures are built one at a time under this
+# lock. They are rendered outside of it, see _figure_to_uri.
+_PLOT_LOCK = threading.Lock()
 
-def make_table(loc):
+# the style stays applied while any thread builds or renders a figure
+_STYLE_LOCK = threading.Lock()
+_STYLE_USERS = 0
+_STYLE_SAVED = None
+_LEGEND_URI = None
+_TEMPLATE = Environment().from_string(html_template.getvalue())
+
+# subclasses of wqio.Location whose statistics are replaced, see
+# _report_location, created by the threads of export_pdfs
+_OVERRIDE_CLASSES = {}
+_OVERRIDE_LOCK = threading.Lock()
+
+# PdfReport of a worker process of ``export_pdfs(processes=True)``
+_WORKER_REPORT = None
+_WORKER_STOP = None
+
+
+def _style():
+    """ rcParams of the report figures.
+    """
+    rc = {}
+    rc.update(sns.axes_style('ticks'))
+    rc.update(sns.plotting_context('paper'))
+    rc.update({
+        'axes.prop_cycle': mpl.cycler(color=sns.color_palette('deep')),
+        'text.usetex': False,
+        'lines.markeredgewidth': .5,
+        'font.family': ['sans-serif'],
+        'mathtext.default': 'regular',
+        'savefig.dpi': 300,
+        'savefig.format': 'png',
+    })
+    return rc
+
+
+@contextmanager
+def _shared_style():
+    """ Applies the report style to the global rcParams for as long as
+    any thread is in this context, and restores them when the last one
+    leaves. Unlike ``matplotlib.rc_context``, several threads can be
+    in it at the same time.
+    """
+    global _STYLE_USERS, _STYLE_SAVED
+    with _STYLE_LOCK:
+        if _STYLE_USERS == 0:
+            style = _style()
+            _STYLE_SAVED = {key: mpl.rcParams[key] for key in style}
+            mpl.rcParams.update(style)
+        _STYLE_USERS += 1
+    try:
+        yield
+    finally:
+        with _STYLE_LOCK:
+            _STYLE_USERS -= 1
+            if _STYLE_USERS == 0:
+                mpl.rcParams.update(_STYLE_SAVED)
+                _STYLE_SAVED = None
+
+
+@contextmanager
+def report_style():
+    """ Context in which the report figures are built. Only one thread
+    can be in this context at a time, so the statistics of the plots
+    should be computed beforehand (see ``_plot_stats``), and the
+    figures rendered afterwards (see ``_figure_to_uri``).
+    """
+    with _PLOT_LOCK:
+        with _shared_style():
+            yield
+
+
+def _new_figure(**kwargs):
+    """ Creates a matplotlib Figure attached to an Agg canvas, without
+    going through pyplot.
+    """
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _figure_to_uri(fig, **savefig_kwargs):
+    """ Renders a figure to a base64-encoded PNG data URI.
+
+    The rasterization does not need ``report_style()``, so the figures
+    of different threads are rendered concurrently. The style still
+    applies to what matplotlib only reads while drawing (e.g. the font
+    of the mathtext tick labels).
+    """
+    options = {key.split('.', 1)[1]: value for key, value in _style().items()
+               if key.startswith('savefig.')}
+    options.update(savefig_kwargs)
+    img = io.BytesIO()
+    with _shared_style():
+        fig.savefig(img, **options)
+    img.seek(0)
+    return ('data:image/png;base64,'
+            + urllib.parse.quote(base64.b64encode(img.read())))
+
+
+def _legend_uri():
+    """ Data URI of the box plot guide. The image is only rendered the
+    first time.
+    """
+    global _LEGEND_URI
+    if _LEGEND_URI is None:
+        with report_style():
+            figl = _new_figure(figsize=(7, 10))
+            axl = figl.add_subplot(1, 1, 1)
+            img = mpimg.imread(os.path.join(os.path.dirname(__file__), 'box.png'))
+
+            axl.imshow(img)
+            axl.xaxis.set_visible(False)
+            axl.yaxis.set_visible(False)
+            sns.despine(ax=axl, top=True, right=True, left=True, bottom=True)
+
+        _LEGEND_URI = _figure_to_uri(figl, bbox_inches='tight')
+    return _LEGEND_URI
+
+
+def statplot(loc, pos=1, yscale='log', notch=True, showmean=True,
+             width=0.8, bacteriaplot=False, ylabel=None, xlabel=None,
+             axtype='prob', patch_artist=False):
+    """ Box plot and probability plot of a wqio.Location side by side.
+
+    Same layout as wqio.Location.statplot, but drawn on a Figure that
+    is not managed by pyplot. Should be called within
+    ``report_style()``.
+
+    Parameters
+    ----------
+    loc : wqio.Location
+        The Location object to be plotted.
+    All other parameters are passed to wqio.Location.boxplot and
+    wqio.Location.probplot.
+
+    Returns
+    -------
+    fig : matplotlib.Figure
+
+    """
+    fig = _new_figure(figsize=(6.40, 3.00), facecolor='none',
+                      edgecolor='none')
+    gs = gridspec.GridSpec(nrows=1, ncols=2, wspace=0.30,
+                           width_ratios=[1, 4])
+
+    ax1 = fig.add_subplot(gs[0])
+    ax2 = fig.add_subplot(gs[1])
+
+    loc.boxplot(ax=ax1, pos=pos, yscale=yscale, notch=notch,
+                showmean=showmean, width=width, bacteriaplot=bacteriaplot,
+                ylabel=ylabel, xlabel=xlabel, patch_artist=patch_artist)
+
+    loc.probplot(ax=ax2, yscale=yscale, axtype=axtype, ylabel=ylabel,
+                 clearYLabels=True)
+
+    ax1.yaxis.tick_left()
+    ax2.yaxis.tick_right()
+    return fig
+
+
+def make_table(loc, intervals=None, iterations=None, methods=None, descriptives=None):
+    """ Tabulates the summary statistics of a wqio.Location.
+
+    Parameters
+    ----------
+    loc : wqio.Location
+        The Location object to be summarized.
+    intervals : dict, optional
+        Confidence intervals keyed by 'mean', 'median', 'logmean', and
+        'geomean' that replace the ones computed by ``loc``.
+    iterations : dict, optional
+        Number of bootstrap iterations used for each interval. When
+        provided, they are listed in the table.
+    methods : dict, optional
+        Method used for the intervals of the 'mean', 'median', and
+        'geomean' (see ``wqreports.core.intervals.METHODS``). When
+        provided, they are listed with the intervals.
+    descriptives : GroupStats, optional
+        Descriptive statistics (count, min, mean, quartiles...) that
+        replace the ones computed by ``loc``, e.g. from
+        ``wqreports.core.descriptive.grouped_stats``.
+
+    Returns
+    -------
+    table : pandas.DataFrame
+
+    """
     # make table
     singlevarfmtr = '{0:.3f}'
     doublevarfmtr = '{0:.3f}; {1:.3f}'
     multilinefmtr = '{0:.3f}\n({1:.3f}; {2:.3f})'
 
-    if loc.logmean is None:
+    # only touch the Location's (bootstrapped) intervals when they
+    # are not provided
+    if intervals is None:
+        intervals = {
+            'mean': loc.mean_conf_interval,
+            'median': loc.median_conf_interval,
+            'logmean': loc.logmean_conf_interval,
+            'geomean': loc.geomean_conf_interval,
+        }
+    mean_conf_interval = intervals['mean']
+    median_conf_interval = intervals['median']
+
+    cilabels = {stat: '(95% confidence interval)' for stat in ['mean', 'median', 'geomean']}
+    if methods is not None:
+        for stat, method in methods.items():
+            cilabels[stat] = '(95% confidence interval,\n{})'.format(ci.LABELS[method])
+
+    if descriptives is None:
+        descriptives = loc
+
+    if descriptives.logmean is None:
         logmean = np.nan
     else:
-        logmean = loc.logmean
-    if loc.geomean is None:
+        logmean = descriptives.logmean
+    if descriptives.geomean is None:
         geomean = np.nan
     else:
-        geomean = loc.geomean
-    if loc.logstd is None:
+        geomean = descriptives.geomean
+    if descriptives.logstd is None:
         logstd = np.nan
     else:
-        logstd = loc.logstd
+        logstd = descriptives.logstd
 
-    if loc.logmean_conf_interval is None:
+    logmean_conf_interval = intervals['logmean']
+    if logmean_conf_interval is None:
         logmean_conf_interval = [np.nan, np.nan]
-    else:
-        logmean_conf_interval = loc.logmean_conf_interval
-    if loc.geomean_conf_interval is None:
+    geomean_conf_interval = intervals['geomean']
+    if geomean_conf_interval is None:
         geomean_conf_interval = [np.nan, np.nan]
-    else:
-        geomean_conf_interval = loc.geomean_conf_interval
 
     rows = [
-        ['Count', singlevarfmtr.format(loc.N)],
-        ['Number of NDs', singlevarfmtr.format(loc.ND)],
+        ['Count', singlevarfmtr.format(descriptives.N)],
+        ['Number of NDs', singlevarfmtr.format(descriptives.ND)],
         ['Min; Max ({})'.format(loc.definition['unit']),
-            doublevarfmtr.format(loc.min,loc.max)],
-        ['Mean ({})\n(95% confidence interval)'.format(loc.definition['unit']),
+            doublevarfmtr.format(descriptives.min,descriptives.max)],
+        ['Mean ({})\n{}'.format(loc.definition['unit'], cilabels['mean']),
             multilinefmtr.format(
-                loc.mean, *loc.mean_conf_interval)],
+                descriptives.mean, *mean_conf_interval)],
         ['Standard Deviation ({})'.format(loc.definition['unit']),
-            singlevarfmtr.format(loc.std)],
-        ['Log. Mean\n(95% confidence interval)', multilinefmtr.format(
+            singlevarfmtr.format(descriptives.std)],
+        ['Log. Mean\n{}'.format(cilabels['geomean']), multilinefmtr.format(
                 logmean, *logmean_conf_interval).replace('nan', '-')],
         ['Log. Standard Deviation', singlevarfmtr.format(logstd).replace('nan', '-')],
-        ['Geo. Mean ({})\n(95% confidence interval)'.format(loc.definition['unit']),
+        ['Geo. Mean ({})\n{}'.format(loc.definition['unit'], cilabels['geomean']),
             multilinefmtr.format(
                 geomean, *geomean_conf_interval).replace('nan', '-')],
-        ['Coeff. of Variation', singlevarfmtr.format(loc.cov)],
-        ['Skewness', singlevarfmtr.format(loc.skew)],
-        ['Median ({})\n(95% confidence interval)'.format(loc.definition['unit']),
+        ['Coeff. of Variation', singlevarfmtr.format(descriptives.cov)],
+        ['Skewness', singlevarfmtr.format(descriptives.skew)],
+        ['Median ({})\n{}'.format(loc.definition['unit'], cilabels['median']),
             multilinefmtr.format(
-                loc.median, *loc.median_conf_interval)],
+                descriptives.median, *median_conf_interval)],
         ['Quartiles ({})'.format(loc.definition['unit']),
-            doublevarfmtr.format(loc.pctl25, loc.pctl75)],
+            doublevarfmtr.format(descriptives.pctl25, descriptives.pctl75)],
     ]
 
+    if iterations is not None:
+        rows.append(['Bootstrap Iterations\n(mean; median; log. mean)',
+            '{0:d}; {1:d}; {2:d}'.format(iterations['mean'], iterations['median'],
+                                         iterations['logmean'])])
+
     return  pd.DataFrame(rows, columns=['Statistic', 'Result'])
 
 
-def make_report(loc, savename, analyte=None, geolocation=None, statplot_options={}, useROS=False):
+def _plot_stats(loc):
+    """ Computes the statistics of a wqio.Location that ``statplot``
+    draws. wqio computes them lazily, and the notch may need a
+    bootstrap, which should not run while ``report_style`` holds the
+    plot lock.
+    """
+    for attr in ('data', 'mean', 'geomean', 'median', 'pctl25', 'pctl75',
+                 'median_conf_interval'):
+        getattr(loc, attr)
+
+
+def _render_statplot(loc, thershold, statplot_options, useROS):
+    """ Builds the statistical plot of the report. Should be called
+    within ``report_style()``.
+    """
+    fig = statplot(loc, **statplot_options)
+
+    ax1, ax2 = fig.get_axes()
+    ax1xlim = ax1.get_xlim()
+    ax2xlim = ax2.get_xlim()
+
+    if loc.dataframe[loc.dataframe[loc.cencol]].shape[0] > 0 and useROS:
+        # print(loc.dataframe.head())
+        qntls, ranked = stats.probplot(loc.data, fit=False)
+        xvalues = stats.norm.cdf(qntls) * 100
+        figdata = loc.dataframe.sort(columns='modeled')
+        figdata['xvalues'] =  xvalues
+        figdata = figdata[figdata[loc.cencol]]
+        ax2.plot(figdata.xvalues, figdata['modeled'], linestyle='', marker='s',
+                 color='tomato', label='Extrapolated values')
+
+
+    ax2.plot(ax2xlim, [thershold]*2, color=sns.color_palette()[-1], label='Threshold')
+
+    handles, labels = ax2.get_legend_handles_labels()
+    labels[0] = 'Data'
+    ax2.legend(handles, labels, loc='best')
+    ax2.set_xlabel('Percent less than value')
+
+    ax1.set_xlim(ax1xlim)
+    ax2.set_xlim(ax2xlim)
+
+    ax2ylim = ax2.get_ylim()
+    ax1.set_ylim(ax2ylim)
+
+    fig.tight_layout()
+    return fig
+
+
+def _report_key(family, values):
+    """ Key of the report of a group: the (geolocation, analyte)
+    values themselves, or the values prefixed with 'family' and the
+    family's name for the additional report families.
+    """
+    if family is None:
+        return values
+    return ('family', family) + values
+
+
+def _report_location(loc, intervals=None, descriptives=None):
+    """ A copy of a wqio.Location that returns the intervals (and the
+    descriptive statistics) computed by the report, for ``statplot``.
+
+    wqio computes the statistics and intervals of a Location lazily,
+    bootstrapping the intervals on the global random state. The box
+    plot of wqio (whose notch is the interval of the median) reads
+    them from the Location's properties, so without this the Location
+    would still run its own bootstrap and the notch would not match
+    the table.
+
+    Parameters
+    ----------
+    loc : wqio.Location
+    intervals : dict, optional
+        Confidence intervals keyed by 'mean', 'median', 'logmean', and
+        'geomean'.
+    descriptives : GroupStats, optional
+        Descriptive statistics of the Location's data.
+
+    Returns
+    -------
+    loc : wqio.Location
+        ``loc`` itself when there is nothing to replace.
+
+    """
+    overrides = {}
+    if descriptives is not None:
+        overrides.update(descriptives._asdict())
+    if intervals is not None:
+        # wqio derives these from its bootstrap as well
+        overrides.setdefault('mean', np.mean(loc.data))
+        overrides.setdefault('median', np.median(loc.data))
+        for stat, CI in intervals.items():
+            overrides['{}_conf_interval'.format(stat)] = CI
+    if not overrides:
+        return loc
+
+    key = (type(loc), frozenset(overrides))
+    with _OVERRIDE_LOCK:
+        if key not in _OVERRIDE_CLASSES:
+            properties = {
+                name: property(lambda self, name=name: self._report_overrides[name])
+                for name in overrides
+            }
+            _OVERRIDE_CLASSES[key] = type(type(loc).__name__, (type(loc),), properties)
+        cls = _OVERRIDE_CLASSES[key]
+
+    view = copy.copy(loc)
+    view.__class__ = cls
+    view._report_overrides = overrides
+    return view
+
+
+def make_report(loc, savename, analyte=None, geolocation=None, statplot_options={}, useROS=False,
+                intervals=None, iterations=None, methods=None, descriptives=None,
+                converter=None, timings=None):
     """ Produces a statistical report for the specified analyte.
 
     Parameters
@@ -96,16 +434,35 @@ def make_report(loc, savename, analyte=None, geolocation=None, statplot_options=
         Optional name for the analyte in the ``loc``'s data.
     statplot_options : dict, optional
         Dictionary of keyward arguments to be passed to
-        wqio.Location.statplot
+        ``statplot``
+    intervals : dict, optional
+        Confidence intervals keyed by 'mean', 'median', 'logmean', and
+        'geomean' that replace the ones computed by ``loc``, in the
+        table as well as in the notch of the box plot.
+    iterations, methods : dict, optional
+        Bootstrap iteration counts and interval methods passed
+        directly to ``make_table``.
+    descriptives : GroupStats, optional
+        Descriptive statistics that replace the ones computed by
+        ``loc``.
+    converter : callable, optional
+        Function that writes the PDF, called as
+        ``converter(html, savename, css=css)``. Defaults to
+        ``pdfkit.from_string``.
+    timings : dict, optional
+        When provided, the seconds spent on the table, the figures,
+        and the PDF are added to its 'stats', 'plot', and 'pdf' items.
 
     Returns
     -------
-    None
+    written : bool
+        False when the Location has fewer than 3 data points, in
+        which case no report is written.
 
     See also
     --------
     wqio.Location
-    wqio.Location.statplot
+    statplot
 
     """
     if loc.full_data.shape[0] >= 3:
@@ -122,68 +479,28 @@ def make_report(loc, savename, analyte=None, geolocation=None, statplot_options=
         if 'xlabel' not in statplot_options:
             statplot_options['xlabel'] = 'Monitoring Location' #used to be geolocation
 
+        if timings is None:
+            timings = {}
+
         # make the table
-        table = make_table(loc)
+        tic = time.time()
+        # the view only stands in for the Location's bootstrapped mean
+        # and median in the table (with ROS), but wqio's box plot
+        # reads everything from it
+        loc = _report_location(loc, intervals=intervals, descriptives=descriptives)
+        table = make_table(loc, intervals=intervals, iterations=iterations,
+                           methods=methods, descriptives=descriptives)
         table_html = table.to_html(index=False, justify='left').replace('\\n', '\n')
+        _plot_stats(loc)
+        timings['stats'] = timings.get('stats', 0.0) + time.time() - tic
 
-        # wqio figure - !can move args to main func later!
-        fig = loc.statplot(**statplot_options)
-
-        ax1, ax2 = fig.get_axes()
-        ax1xlim = ax1.get_xlim()
-        ax2xlim = ax2.get_xlim()
-
-        if loc.dataframe[loc.dataframe[loc.cencol]].shape[0] > 0 and useROS:
-            # print(loc.dataframe.head())
-            qntls, ranked = stats.probplot(loc.data, fit=False)
-            xvalues = stats.norm.cdf(qntls) * 100
-            figdata = loc.dataframe.sort(columns='modeled')
-            figdata['xvalues'] =  xvalues
-            figdata = figdata[figdata[loc.cencol]]
-            ax2.plot(figdata.xvalues, figdata['modeled'], linestyle='', marker='s',
-                     color='tomato', label='Extrapolated values')
-
-
-        ax2.plot(ax2xlim, [thershold]*2, color=sns.color_palette()[-1], label='Threshold')
-
-        handles, labels = ax2.get_legend_handles_labels()
-        labels[0] = 'Data'
-        ax2.legend(handles, labels, loc='best')
-        ax2.set_xlabel('Percent less than value')
-
-        ax1.set_xlim(ax1xlim)
-        ax2.set_xlim(ax2xlim)
-
-        ax2ylim = ax2.get_ylim()
-        ax1.set_ylim(ax2ylim)
-
-        fig.tight_layout()
-
+        tic = time.time()
+        with report_style():
+            fig = _render_statplot(loc, thershold, statplot_options, useROS)
         # force figure to a byte object in memory then encode
-        boxplot_img = io.BytesIO()
-        fig.savefig(boxplot_img, format="png", dpi=300)
-        boxplot_img.seek(0)
-        boxplot_uri = ('data:image/png;base64,'
-            + urllib.parse.quote(base64.b64encode(boxplot_img.read())))
-
-        # box plot legend
-        figl, axl = plt.subplots(1,1, figsize=(7,10))
-        img = mpimg.imread('box.png')
-
-        axl.imshow(img)
-        axl.xaxis.set_visible(False)
-        axl.yaxis.set_visible(False)
-        sns.despine(ax=axl, top=True, right=True, left=True, bottom=True)
-
-        legend_img = io.BytesIO()
-        figl.savefig(legend_img, format="png", dpi=300, bbox_inches='tight')
-        legend_img.seek(0)
-        legend_uri = ('data:image/png;base64,'
-            + urllib.parse.quote(base64.b64encode(legend_img.read())))
-
-        # html magic
-        env = Environment(loader=FileSystemLoader(r'.\utils'))
-        template = env.from_string(html_template.getvalue())
+        boxplot_uri = _figure_to_uri(fig)
+        legend_uri = _legend_uri()
+        timings['plot'] = timings.get('plot', 0.0) + time.time() - tic
 
         # create pdf report
         template_vars = {'analyte' : analyte,
@@ -192,23 +509,27 @@ def make_report(loc, savename, analyte=None, geolocation=None, statplot_options=
                          'legend': legend_uri,
                          'boxplot': boxplot_uri}
 
-        html_out = template.render(template_vars)
+        tic = time.time()
+        html_out = _TEMPLATE.render(template_vars)
         csst = copy.copy(css_template)
         try:
             print('Creating report {}'.format(savename))
-            pdf = pdfkit.from_string(html_out, savename, css=csst)
+            if converter is None:
+                converter = pdfkit.from_string
+            pdf = converter(html_out, savename, css=csst)
         except OSError as e:
             raise OSError('The tool cannot write to the destination path. '
                           'Please check that the destination pdf is not open.\n'
                           'Trace back:\n{}'.format(e))
-        plt.close(fig)
-        del boxplot_img
-        del figl
+        timings['pdf'] = timings.get('pdf', 0.0) + time.time() - tic
+        written = True
     else:
         print('{} does not have greater than 3 data points, skipping...'.format(savename))
+        written = False
 
     print('\n')
     gc.collect()
+    return written
 
 
 class PdfReport(object):
@@ -230,12 +551,56 @@ class PdfReport(object):
         right-censored (non-detect). Any value in ``qualcol`` that is
         *not* in this list will be assumed to denote an uncensored
         (detected value).
-    bsIter : int (default = 10000)
+    bsIter : int (default = 5000)
         Number of iterations used to refined statistics via a bias-
-        corrected and accelerated (BCA) bootstrapping method.
+        corrected and accelerated (BCA) bootstrapping method. When
+        ``bsTol`` is provided, this is the upper limit of the adaptive
+        bootstrap instead.
     useROS : bool (default is True)
         Toggles the use of regression-on-order statistics to estimate
         censored (non-detect) values when computing summary statistics.
+    bsTol : float, optional
+        Toggles the adaptive bootstrap. Resampling is done in blocks of
+        ``bsBlock`` iterations and stops once neither confidence bound
+        moves by more than ``bsTol`` times the width of the interval.
+        The iterations used for each group are recorded in
+        ``bsIterations``.
+    bsBlock : int (default = 500)
+        Number of iterations per block of the adaptive bootstrap.
+    seed : int, optional
+        Seed of the bootstrap. When provided, each (geolocation,
+        analyte) group resamples from its own random stream derived
+        from ``seed`` and the group's key, so the intervals, and the
+        notches of the box plots drawn from them, do not depend on the
+        processing order or on the number of workers.
+    cache : bool or str, optional
+        Toggles the ingest cache. When True, the cleaned data are
+        cached in a ".wqreports_cache" folder next to ``path``; a
+        string sets the cache folder instead. The cached copy is
+        reused, memory-mapped, as long as the size, modification time
+        and content of ``path`` and the column and ``ndvals`` options
+        are unchanged. The content of ``path`` is only read again when
+        its size or modification time change. Requires pyarrow.
+    converter : callable, optional
+        Function that writes the PDFs, called as
+        ``converter(html, savename, css=css)``. Defaults to
+        ``pdfkit.from_string``.
+    families : dict, optional
+        Additional report families, exported along with the
+        (geolocation, analyte) reports. Maps the name of each family
+        to the list of columns that define its groups, e.g.
+        ``{'season': ['location', 'season', 'analyte']}``. The columns
+        must include ``analytecol`` and at least one other column,
+        which make up the report's geolocation. All families share a
+        single ``GroupIndex`` of the data.
+    ciMethods : str or dict, optional
+        Method of the confidence intervals. Either 'bootstrap' or
+        'analytic' for all of the statistics, or a dictionary of the
+        method of the 'mean' ('bootstrap' or 't'), 'median'
+        ('bootstrap' or 'binomial'), and 'geomean' ('bootstrap' or
+        'lognormal'). When provided, the method of each interval is
+        listed in the report table. The analytic intervals are much
+        cheaper than the bootstrap.
 
     Examples
     --------
@@ -248,13 +613,27 @@ class PdfReport(object):
     def __init__(self, path, analytecol='analyte', rescol='res',
                  qualcol='qual', unitcol='unit', locationcol='location',
                  thersholdcol='threshold', ndvals=['U'], bsIter=5000,
-                 useROS=False):
+                 useROS=False, bsTol=None, bsBlock=500, seed=None,
+                 cache=None, converter=None, families=None, ciMethods=None):
 
         self.filepath = path
         self.ndvals = ndvals
         self.final_ndval = 'ND'
         self.bsIter = bsIter
+        if bsTol is not None and bsTol < 0:
+            raise ValueError('`bsTol` must not be negative, not {}'.format(bsTol))
+        if bsBlock < 1:
+            raise ValueError('`bsBlock` must be a positive number of iterations, '
+                             'not {}'.format(bsBlock))
+        self.bsTol = bsTol
+        self.bsBlock = bsBlock
+        self.seed = seed
+        self.ciMethods = ciMethods
+        if ciMethods is not None:
+            ci.resolve_methods(ciMethods)
         self.useROS = useROS
+        self.converter = converter
+        self.bsIterations = {}
 
         self.analytecol = analytecol
         self.unitcol = unitcol
@@ -262,13 +641,29 @@ class PdfReport(object):
         self.thersholdcol = thersholdcol
         self.rescol = rescol
         self.qualcol = qualcol
+        self.groupcols = [locationcol, analytecol]
+
+        self.families = dict(families or {})
+        for name, columns in self.families.items():
+            if analytecol not in columns:
+                raise ValueError('The columns of the {} family must include {}'
+                                 .format(name, analytecol))
+            if not set(columns) - {analytecol}:
+                raise ValueError('The columns of the {} family must include a '
+                                 'column other than {}'.format(name, analytecol))
+
+        if cache is True:
+            cache = ingest_cache.default_folder(path)
+        self.cache = cache or None
 
         self._rawdata = None
         self._cleandata = None
         self._analytes = None
         self._geolocations = None
         self._thresholds = None
-        self._locations = None
+        self._groups = None
+        self._family_locations = {}
+        self._group_stats = None
 
     @property
     def rawdata(self):
@@ -292,12 +687,46 @@ class PdfReport(object):
         """ Cleaned data with simpler qualifiers.
         """
         if self._cleandata is None:
-            self._cleandata = (
-                self.rawdata
-                    .replace({self.qualcol:{_: self.final_ndval for _ in self.ndvals}})
-            )
+            if self.cache is not None:
+                key = ingest_cache.cache_key(self.filepath, self._cache_config(),
+                                             folder=self.cache)
+                self._cleandata = ingest_cache.load(self.cache, self.filepath, key)
+
+            if self._cleandata is None:
+                self._cleandata = (
+                    self.rawdata
+                        .replace({self.qualcol:{_: self.final_ndval for _ in self.ndvals}})
+                )
+                if self.cache is not None:
+                    # in the order of the group index, so that it does
+                    # not copy the data that are loaded from the cache
+                    self._cleandata = (
+                        sort_groups(self._cleandata, self._groupcolumns)
+                            .reset_index(drop=True)
+                    )
+                    ingest_cache.store(self.cache, self.filepath, key, self._cleandata,
+                                       categories=self._labelcols)
         return self._cleandata
 
+    @property
+    def _labelcols(self):
+        """ Text columns of the data, stored as categoricals in the
+        ingest cache.
+        """
+        return [self.analytecol, self.unitcol, self.locationcol, self.qualcol]
+
+    def _cache_config(self):
+        """ Options that determine the content of ``cleandata`` and the
+        order of its rows.
+        """
+        return {
+            'columns': [self.analytecol, self.unitcol, self.locationcol,
+                        self.thersholdcol, self.rescol, self.qualcol],
+            'ndvals': list(self.ndvals),
+            'final_ndval': self.final_ndval,
+            'order': self._groupcolumns,
+        }
+
     @property
     def analytes(self):
         """ Simple list of the analytes to be analyzed.
@@ -334,59 +763,386 @@ class PdfReport(object):
         return self._thresholds
 
 
+    @property
+    def groups(self):
+        """ GroupIndex of the data over the columns of all of the
+        report families.
+        """
+        if self._groups is None:
+            self._groups = GroupIndex(self.cleandata, self._groupcolumns)
+        return self._groups
+
+    @property
+    def _groupcolumns(self):
+        """ Columns of the group index: the report's groups first, then
+        the other columns of the report families.
+        """
+        columns = list(self.groupcols)
+        for name in sorted(self.families):
+            columns.extend(c for c in self.families[name] if c not in columns)
+        return columns
+
     @property
     def locations(self):
         """ Simple list of wqio.Location objects for each analyte.
         """
-        if self._locations is None:
-            self._locations = {}
-            gb = self.cleandata.groupby([self.locationcol, self.analytecol])
-            for gl, a in gb.groups.keys():
-                loc = self._make_location(gl, a)
-                loc.definition.update({"analyte": a, "geolocation": gl})
-                self._locations[(gl, a)] = loc
+        return self.family_locations(self.groupcols)
+
+    def family_locations(self, columns):
+        """ wqio.Location objects for each group of a report family.
+
+        Parameters
+        ----------
+        columns : list of str
+            Columns that define the groups. Must include
+            ``analytecol``.
+
+        Returns
+        -------
+        locations : dict
+            wqio.Location objects keyed by the tuple of the group's
+            values in ``columns``.
+
+        """
+        columns = tuple(columns)
+        if columns not in self._family_locations:
+            locations = {}
+            for key in self.groups.groups(columns).keys():
+                locations[key] = self._make_location(*key, columns=columns)
+            self._family_locations[columns] = locations
 
-        return self._locations
+        return self._family_locations[columns]
 
-    def _make_location(self, location, analyte):
-        """ Make a wqio.Location from an analyte.
+    def _make_location(self, *key, columns=None):
+        """ Make a wqio.Location from a group of the data.
 
         Parameters
         ----------
-        analyte : string
-            The pollutant to be included in the Location.
+        key : strings
+            Values of the group in ``columns``, e.g. the location and
+            the analyte.
+        columns : list of str, optional
+            Columns that define the group. Defaults to
+            [locationcol, analytecol].
 
         Returns
         -------
         loc : wqio.Location
-            A wqio.Location object for the provided analyte.
+            A wqio.Location object for the provided group.
 
         """
-        if analyte not in self.analytes:
-            raise ValueError("{} is not in the dataset".format(analyte))
-        if location not in self.geolocations:
-            raise ValueError("{} is not in the dataset".format(location))
+        if columns is None:
+            columns = self.groupcols
+        columns = tuple(columns)
 
-        # get target analyte
-        querystring = "{} == @location and {} == @analyte".format(self.locationcol, self.analytecol)
-        data = self.cleandata.query(querystring)
+        rows = self.groups.groups(columns).get(key)
+        if rows is None:
+            raise ValueError("{} is not in the dataset".format(key))
+
+        data = self.groups.frame(rows)
+
+        # wqio expects plain text columns
+        categories = [col for col in self._labelcols if str(data[col].dtype) == 'category']
+        if categories:
+            data = data.astype({col: object for col in categories})
 
         if data[self.unitcol].unique().shape[0] > 1:
-            e = 'More than one unit detected for {}-{}. Please check the input file'
-            raise ValueError(e)
+            e = 'More than one unit detected for {}. Please check the input file'
+            raise ValueError(e.format(key))
+
+        values = dict(zip(columns, key))
+        analyte = values[self.analytecol]
+        geolocation = ' - '.join(str(values[col]) for col in columns if col != self.analytecol)
 
         loc = wqio.features.Location(data, bsIter=self.bsIter, ndval=self.final_ndval,
                                      rescol=self.rescol, qualcol=self.qualcol,
                                      useROS=self.useROS, include=True)
         loc.definition = {
             'unit': data[self.unitcol].iloc[0],
-            'thershold': self.thresholds[analyte]
+            'thershold': self.thresholds[analyte],
+            'analyte': analyte,
+            'geolocation': geolocation,
         }
 
         return loc
 
-    def export_pdfs(self, output_path, basename=None, **statplot_options):
-        """ Export 1-pg summary PDF for each analyte in the data.
+    def _report_families(self):
+        """ Name and columns of each report family, the (geolocation,
+        analyte) reports first with a name of None.
+        """
+        families = [(None, self.groupcols)]
+        for name in sorted(self.families):
+            families.append((name, self.families[name]))
+        return families
+
+    def _job_groups(self):
+        """ Columns and values of the group of every report to be
+        exported. The keys of the (geolocation, analyte) reports are
+        their (geolocation, analyte); those of the other families are
+        prefixed with 'family' and the family's name.
+        """
+        groups = {}
+        for name, columns in self._report_families():
+            for values in self.groups.groups(columns).keys():
+                groups[_report_key(name, values)] = (tuple(columns), values)
+        return groups
+
+    def _jobs(self):
+        """ Key and wqio.Location of every report to be exported,
+        keyed like ``_job_groups``.
+        """
+        return {
+            key: self.family_locations(columns)[values]
+            for key, (columns, values) in self._job_groups().items()
+        }
+
+    def _worker_options(self):
+        """ Options of the PdfReport of a worker process.
+        """
+        return {
+            'analytecol': self.analytecol, 'rescol': self.rescol,
+            'qualcol': self.qualcol, 'unitcol': self.unitcol,
+            'locationcol': self.locationcol, 'thersholdcol': self.thersholdcol,
+            'ndvals': self.ndvals, 'bsIter': self.bsIter, 'useROS': self.useROS,
+            'bsTol': self.bsTol, 'bsBlock': self.bsBlock, 'seed': self.seed,
+            'converter': self.converter, 'families': self.families,
+            'ciMethods': self.ciMethods,
+        }
+
+    def _conf_intervals(self, key, loc):
+        """ Confidence intervals of a Location computed with the
+        selected methods and/or the adaptive or seeded bootstrap.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the report, e.g. the (geolocation, analyte) of the
+            Location.
+        loc : wqio.Location
+            The Location object to be summarized.
+
+        Returns
+        -------
+        intervals, iterations : dict or None
+            Inputs to ``make_table``. Both are ``None`` when none of
+            ``bsTol``, ``seed``, and ``ciMethods`` is set, in which
+            case the Location's own intervals are used. ``iterations``
+            is only provided by the adaptive bootstrap.
+
+        """
+        if self.bsTol is None and self.seed is None and self.ciMethods is None:
+            return None, None
+        if loc.full_data.shape[0] < 3:
+            return None, None
+
+        rng = None
+        if self.seed is not None:
+            rng = bootstrap.group_rng(self.seed, key)
+
+        intervals, iterations = ci.conf_intervals(
+            loc.data, methods=self.ciMethods, bsIter=self.bsIter, tol=self.bsTol,
+            block=self.bsBlock, rng=rng)
+        if self.bsTol is None:
+            return intervals, None
+
+        self.bsIterations[key] = iterations
+        return intervals, iterations
+
+    def group_stats(self):
+        """ Descriptive statistics of every report, computed in one
+        vectorized pass over the data of each report family.
+
+        Returns
+        -------
+        stats : dict
+            GroupStats keyed like the reports of ``export_pdfs``.
+            Empty when ``useROS`` is True, since the statistics of the
+            ROS estimates are computed by each Location.
+
+        See also
+        --------
+        wqreports.core.descriptive.grouped_stats
+
+        """
+        if self._group_stats is None:
+            # published only once complete, since the threads of
+            # export_pdfs read it
+            group_stats = {}
+            if not self.useROS:
+                values = self.groups.data[self.rescol]
+                isND = self.groups.data[self.qualcol] == self.final_ndval
+                for name, columns in self._report_families():
+                    found = descriptive.grouped_stats(values, isND,
+                                                      self.groups.groups(columns))
+                    for key, descriptives in found.items():
+                        group_stats[_report_key(name, key)] = descriptives
+            self._group_stats = group_stats
+        return self._group_stats
+
+    def estimate_costs(self):
+        """ Relative cost of the statistics of each report, based on the
+        number of rows and non-detects of its group.
+
+        Returns
+        -------
+        costs : dict
+            Keyed like the reports of ``export_pdfs``.
+
+        See also
+        --------
+        wqreports.core.scheduler.estimate_cost
+
+        """
+        isND = np.asarray(self.groups.data[self.qualcol] == self.final_ndval)
+        methods = ci.resolve_methods(self.ciMethods)
+        bootstrapped = sum(method == 'bootstrap' for method in methods.values())
+
+        costs = {}
+        for name, columns in self._report_families():
+            for key, rows in self.groups.groups(columns).items():
+                N, ND = isND[rows].shape[0], isND[rows].sum()
+                costs[_report_key(name, key)] = scheduler.estimate_cost(N, ND, bsIter=self.bsIter,
+                                                     useROS=self.useROS,
+                                                     bootstrapped=bootstrapped)
+        return costs
+
+    def _export_pdf(self, key, loc, filename, statplot_options, timings=None):
+        """ Computes the intervals of one Location and writes its PDF.
+        Returns False when the Location has too few data for a report.
+        """
+        geolocation = loc.definition['geolocation']
+        analyte = loc.definition['analyte']
+        if timings is None:
+            timings = {}
+
+        # need to make a copy so that the dict does not get changed in
+        # the low functions
+        spo = copy.copy(statplot_options)
+        tic = time.time()
+        intervals, iterations = self._conf_intervals(key, loc)
+        timings['stats'] = time.time() - tic
+
+        methods = None
+        if self.ciMethods is not None:
+            methods = ci.resolve_methods(self.ciMethods)
+
+        return make_report(loc, filename, analyte=analyte, geolocation=geolocation,
+         statplot_options=spo, useROS=self.useROS, intervals=intervals,
+         iterations=iterations, methods=methods, descriptives=self.group_stats().get(key),
+         converter=self.converter, timings=timings)
+
+    def _run_export(self, job, statplot_options, journal, errors, progress,
+                    stop=None):
+        """ Exports the PDF of one group and records the outcome in the
+        journal and the progress.
+
+        Parameters
+        ----------
+        stop : threading.Event, optional
+            Set by the first report that fails when ``errors`` is
+            'raise'. The reports that start afterwards are dropped
+            (and not journaled).
+
+        Returns
+        -------
+        key : tuple
+            Key of the report.
+        error : Exception or None
+            The error raised by a failed group when ``errors`` is
+            'continue'.
+
+        """
+        key, loc, filename = job
+        if stop is not None and stop.is_set():
+            return key, None
+
+        timings = {}
+        try:
+            written = self._export_pdf(key, loc, filename, statplot_options, timings)
+        except Exception as e:
+            if stop is not None and errors == 'raise':
+                stop.set()
+            journal.record(key, filename, Journal.FAILED, error=str(e))
+            progress.update(key)
+            if errors == 'raise':
+                raise
+            print('Failed to create report {}:\n{}\n'.format(filename, e))
+            return key, e
+
+        journal.record(key, filename, Journal.DONE if written else Journal.SKIPPED)
+        progress.update(key, timings)
+        return key, None
+
+    def _export_processes(self, jobs, statplot_options, journal, errors,
+                          progress, max_workers):
+        """ Exports the PDFs with a pool of processes that build their
+        Locations from a single copy of the data in shared memory.
+
+        Returns
+        -------
+        results : list of (key, error) tuples
+            As returned by ``_run_export``.
+
+        """
+        groupings = [columns for name, columns in self._report_families()]
+        # set by the worker of the first report that fails, so that the
+        # workers drop the reports that they have not started yet
+        stop = multiprocessing.Event() if errors == 'raise' else None
+        with SharedDataset.publish(self.groups, groupings) as dataset:
+            initargs = (self.filepath, self._worker_options(), dataset.handle,
+                        self.thresholds, self.group_stats(), stop)
+            with futures.ProcessPoolExecutor(max_workers=max_workers,
+                                             initializer=_init_worker,
+                                             initargs=initargs) as executor:
+                tasks = {
+                    executor.submit(_worker_export, key, columns, values, filename,
+                                    statplot_options): (key, filename)
+                    for key, columns, values, filename in jobs
+                }
+
+                results = []
+                failure = None
+                for task in futures.as_completed(tasks):
+                    key, filename = tasks[task]
+                    if task.cancelled():
+                        continue
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        journal.record(key, filename, Journal.FAILED, error=str(e))
+                        progress.update(key)
+                        if errors == 'raise':
+                            # stop at the first failure, but still record
+                            # the reports that were already running
+                            if failure is None:
+                                failure = e
+                                for pending in tasks:
+                                    pending.cancel()
+                            continue
+                        print('Failed to create report {}:\n{}\n'.format(filename, e))
+                        results.append((key, e))
+                        continue
+
+                    if result is None:
+                        # dropped after the first failure
+                        continue
+
+                    written, timings, iterations = result
+                    if iterations is not None:
+                        self.bsIterations[key] = iterations
+                    journal.record(key, filename, Journal.DONE if written else Journal.SKIPPED)
+                    progress.update(key, timings)
+                    results.append((key, None))
+
+        if failure is not None:
+            raise failure
+        return results
+
+    def export_pdfs(self, output_path, basename=None, max_workers=None,
+                    journal=None, resume=False, errors='raise',
+                    processes=False, **statplot_options):
+        """ Export 1-pg summary PDF for each analyte in the data, and
+        for each group of the additional report families.
 
         Parameters
         ----------
@@ -394,24 +1150,169 @@ class PdfReport(object):
             Folder path in which all PDFs will be saved
         basename : string, optional
             Prefix for the filename of each PDF. If omitted, the
-            filename will simply the be analyte.
+            filename will simply the be analyte. The filenames of the
+            additional report families start with "family-", the
+            family's name, and a dash.
+        max_workers : int, optional
+            When provided, the reports are produced by a pool of this
+            many threads. The figures are still drawn one at a time,
+            but the statistics and the PDF conversion of different
+            reports overlap. If omitted, the reports are produced
+            sequentially. Either way, the groups with the largest
+            estimated cost are processed first and the progress is
+            printed with an estimate of the time left.
+        journal : string, optional
+            Filepath of the journal in which the completed and failed
+            reports are recorded. Defaults to
+            "<basename>wqreports_journal.jsonl" in ``output_path``.
+        resume : bool (default = False)
+            When True, the reports that the journal records as
+            completed (and that still exist) are not produced again,
+            nor are the groups that were skipped for having too few
+            data.
+        errors : string (default = 'raise')
+            Either 'raise' to stop at the first report that fails, or
+            'continue' to record the failure in the journal and move
+            on to the next report.
+        processes : bool (default = False)
+            When True, the ``max_workers`` workers (by default, one per
+            CPU) are processes instead of threads, so that the figures
+            are drawn in parallel as well. The cleaned data are published once in
+            shared memory, from which each process builds the data of
+            its groups, rather than being copied to (or re-read by)
+            every process. ``converter`` must then be picklable.
         statplot_options : optional keyword arguments
-            Options passed directly to wqio.Location.statplot
+            Options passed directly to ``statplot``
+
+        Returns
+        -------
+        failed : dict
+            Errors of the reports that failed in this run, keyed by
+            (geolocation, analyte), or by ('family', name, values...)
+            for the additional report families. Only populated when ``errors``
+            is 'continue'.
 
         """
 
+        if errors not in ('raise', 'continue'):
+            raise ValueError("`errors` must be 'raise' or 'continue', not {}".format(errors))
+
         if basename is None:
             basename = ""
 
-        for (geolocation, analyte), loc in self.locations.items():
-            san_geolocation = wqio.utils.processFilename(geolocation)
-            san_analyte = wqio.utils.processFilename(analyte)
-            filename = os.path.join(output_path, '{}{}{}.pdf'.format(
-                basename, san_geolocation, san_analyte))
+        if processes and max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if journal is None:
+            journal = os.path.join(output_path, '{}wqreports_journal.jsonl'.format(basename))
+        journal = Journal(journal)
 
-            # need to make a copy so that the dict does not get changed in
-            # the low functions
-            spo = copy.copy(statplot_options)
+        completed = set()
+        if resume:
+            completed = journal.completed() | journal.skipped()
 
-            make_report(loc, filename, analyte=analyte, geolocation=geolocation,
-             statplot_options=spo, useROS=self.useROS)
+        # the most expensive groups go first so that they do not hold
+        # up the end of the batch
+        costs = {
+            key: cost for key, cost in self.estimate_costs().items()
+            if key not in completed
+        }
+
+        groups = self._job_groups()
+        jobs = []
+        for key in scheduler.schedule(costs):
+            columns, values = groups[key]
+            sanitized = ''.join(wqio.utils.processFilename(str(v)) for v in values)
+            if len(key) > len(values):
+                # keep the families apart from the (geolocation, analyte) reports
+                sanitized = 'family-{}-{}'.format(wqio.utils.processFilename(key[1]), sanitized)
+            filename = os.path.join(output_path, '{}{}.pdf'.format(basename, sanitized))
+            jobs.append((key, columns, values, filename))
+
+        if resume:
+            print('Resuming: {} reports already completed, {} to go\n'.format(
+                len(completed), len(jobs)))
+
+        # computed once, before the workers need them
+        self.group_stats()
+
+        progress = scheduler.Progress(costs, workers=max_workers or 1)
+        if processes:
+            results = self._export_processes(jobs, statplot_options, journal,
+                                             errors, progress, max_workers)
+        else:
+            # only the threads share the Locations of the parent
+            locations = self._jobs()
+            jobs = [
+                (key, locations[key], filename)
+                for key, columns, values, filename in jobs
+            ]
+            if max_workers is None:
+                results = [
+                    self._run_export(job, statplot_options, journal, errors, progress)
+                    for job in jobs
+                ]
+            else:
+                stop = threading.Event()
+                with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    tasks = [
+                        executor.submit(self._run_export, job, statplot_options,
+                                        journal, errors, progress, stop)
+                        for job in jobs
+                    ]
+                    try:
+                        results = [task.result() for task in futures.as_completed(tasks)]
+                    except Exception:
+                        # stop at the first failure: the reports that are
+                        # already running finish (and are journaled), the
+                        # others are dropped
+                        for task in tasks:
+                            task.cancel()
+                        raise
+
+        return {key: error for key, error in results if error is not None}
+
+
+def _init_worker(path, options, handle, thresholds, group_stats, stop=None):
+    """ Initializes a worker process of ``PdfReport.export_pdfs`` with
+    a PdfReport whose data are attached from shared memory.
+    """
+    global _WORKER_REPORT, _WORKER_STOP
+    _WORKER_STOP = stop
+    report = PdfReport(path, **options)
+    report._groups = SharedDataset.attach(handle)
+    report._thresholds = thresholds
+    report._group_stats = group_stats
+    _WORKER_REPORT = report
+
+
+def _worker_export(key, columns, values, filename, statplot_options):
+    """ Exports the PDF of one group in a worker process.
+
+    Returns
+    -------
+    written : bool
+        False when the group has too few data for a report.
+    timings : dict
+        Seconds spent in each stage of the report.
+    iterations : dict or None
+        Bootstrap iterations of the adaptive intervals.
+
+    None is returned instead when an earlier report of the batch failed
+    and the group was dropped.
+
+    """
+    stop = _WORKER_STOP
+    if stop is not None and stop.is_set():
+        return None
+
+    report = _WORKER_REPORT
+    loc = report._make_location(*values, columns=columns)
+    timings = {}
+    try:
+        written = report._export_pdf(key, loc, filename, statplot_options, timings)
+    except Exception:
+        if stop is not None:
+            stop.set()
+        raise
+    return written, timings, report.bsIterations.pop(key, None)
@@ -0,0 +1,155 @@
+import sys
+import time
+import datetime
+import threading
+
+import numpy as np
+
+
+STAGES = ('stats', 'plot', 'pdf')
+
+
+def estimate_cost(N, ND=0, bsIter=5000, useROS=False, bootstrapped=3):
+    """ Relative cost of the statistics of a group of data.
+
+    The cost is dominated by the bootstrapped intervals of the mean,
+    the median (which sorts each resample), and the log-mean, plus
+    their jackknife and, optionally, the ROS estimates of the
+    non-detects. The units are arbitrary; ``Progress`` converts them
+    to seconds from the observed timings.
+
+    Parameters
+    ----------
+    N : int
+        Number of rows in the group.
+    ND : int (default = 0)
+        Number of non-detects in the group.
+    bsIter : int (default = 5000)
+        Number of bootstrap iterations.
+    useROS : bool (default = False)
+        Whether the non-detects are estimated with ROS.
+    bootstrapped : int (default = 3)
+        Number of bootstrapped intervals; the others are computed
+        analytically at a negligible cost.
+
+    Returns
+    -------
+    cost : float
+
+    """
+    if N < 3:
+        return 0.0
+
+    logN = np.log2(N)
+    cost = bootstrapped / 3.0 * (bsIter * N * (2.0 + logN) + 3.0 * N**2) + N * logN
+    if useROS and ND > 0:
+        cost += N * logN * (1.0 + float(ND) / N) * 100
+    return float(cost)
+
+
+def schedule(costs):
+    """ Orders jobs so that the most expensive ones start first.
+
+    Parameters
+    ----------
+    costs : dict
+        Estimated cost of each job, keyed by the job's key.
+
+    Returns
+    -------
+    keys : list
+        The keys of ``costs``, most expensive first. Ties keep their
+        original order.
+
+    """
+    return sorted(costs.keys(), key=lambda k: -costs[k])
+
+
+class Progress(object):
+    """ Tracks a batch of jobs and estimates the time left.
+
+    The time of the 'stats' stage of a job is assumed proportional to
+    its estimated cost, while the 'plot' and 'pdf' stages take about
+    the same time for every job (``make_report`` computes everything
+    the figures need, bootstrapped intervals included, in the 'stats'
+    stage). Both rates are calibrated from the timings of the
+    completed jobs.
+
+    Parameters
+    ----------
+    costs : dict
+        Estimated cost of each job, keyed by the job's key.
+    workers : int (default = 1)
+        Number of jobs that run concurrently.
+    stream : file-like, optional
+        Where the progress is printed. Defaults to sys.stdout; None
+        silences it.
+
+    """
+
+    def __init__(self, costs, workers=1, stream=sys.stdout):
+        self.costs = costs
+        self.workers = workers
+        self.stream = stream
+
+        self.total = len(costs)
+        self.completed = 0
+        self.remaining_cost = float(sum(costs.values()))
+        self.timings = {stage: 0.0 for stage in STAGES}
+
+        self._done_cost = 0.0
+        self._start = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def eta(self):
+        """ Estimated number of seconds until all jobs are completed,
+        or None until a job has been completed.
+        """
+        if self.completed == 0:
+            return None
+
+        if self._done_cost > 0:
+            stats_rate = self.timings['stats'] / self._done_cost
+        else:
+            stats_rate = 0.0
+        fixed = (self.timings['plot'] + self.timings['pdf']) / self.completed
+
+        left = stats_rate * self.remaining_cost + fixed * (self.total - self.completed)
+        return left / max(1, min(self.workers, self.total - self.completed))
+
+    def update(self, key, timings=None):
+        """ Records a completed job.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the completed job.
+        timings : dict, optional
+            Seconds spent in each stage ('stats', 'plot', 'pdf') of
+            the job.
+
+        """
+        with self._lock:
+            self.completed += 1
+            cost = self.costs.get(key, 0.0)
+            self.remaining_cost = max(0.0, self.remaining_cost - cost)
+            if timings is not None:
+                self._done_cost += cost
+                for stage in STAGES:
+                    self.timings[stage] += timings.get(stage, 0.0)
+
+            if self.stream is not None:
+                self.stream.write(self.status() + '\n')
+
+    def status(self):
+        """ One-line summary of the progress.
+        """
+        elapsed = datetime.timedelta(seconds=int(time.time() - self._start))
+        eta = self.eta
+        if eta is None:
+            eta = '-'
+        else:
+            eta = datetime.timedelta(seconds=int(round(eta)))
+        return 'Completed {} of {} reports (elapsed {}, ETA {})'.format(
+            self.completed, self.total, elapsed, eta)
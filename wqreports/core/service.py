@@ -0,0 +1,261 @@
+import os
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from urllib.parse import urlparse, parse_qs
+
+from . import pdfreport
+
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownGroup(KeyError):
+    """ The requested (geolocation, analyte) is not in the dataset.
+    """
+
+
+class LRUCache(object):
+    """ Thread-safe, bounded mapping that discards the least recently
+    used items first.
+
+    Parameters
+    ----------
+    maxsize : int (default = 128)
+        Largest number of items kept.
+
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class ReportService(object):
+    """ Keeps a PdfReport and its data loaded to produce individual
+    reports on demand.
+
+    The PDFs are kept in an LRU cache. The source data are reloaded,
+    and the cache emptied, when the size or modification time of the
+    source file change.
+
+    Parameters
+    ----------
+    path : str
+        Filepath to the CSV file containing input data.
+    maxsize : int (default = 128)
+        Number of PDFs kept in the cache.
+    report_options : optional keyword arguments
+        Options passed directly to PdfReport.
+
+    """
+
+    def __init__(self, path, maxsize=128, **report_options):
+        self.path = path
+        self.report_options = report_options
+        self.cache = LRUCache(maxsize=maxsize)
+
+        self._report = None
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _source_stamp(self):
+        stat = os.stat(self.path)
+        return (stat.st_size, stat.st_mtime)
+
+    @property
+    def report(self):
+        """ The PdfReport of the current version of the source data.
+        """
+        with self._lock:
+            stamp = self._source_stamp()
+            if self._report is None or stamp != self._stamp:
+                report = pdfreport.PdfReport(self.path, **self.report_options)
+                report.locations
+                self._report = report
+                self._stamp = stamp
+                self.cache.clear()
+            return self._report
+
+    def warm(self):
+        """ Loads the data and renders the static parts of the reports.
+        """
+        self.report
+        pdfreport._legend_uri()
+
+    def render(self, geolocation, analyte, **statplot_options):
+        """ PDF report of a (geolocation, analyte).
+
+        Parameters
+        ----------
+        geolocation, analyte : str
+            The group to be summarized.
+        statplot_options : optional keyword arguments
+            Options passed directly to ``statplot``. The PDFs made with
+            options are not cached.
+
+        Returns
+        -------
+        pdf : bytes or None
+            The content of the PDF, or None when the group has fewer
+            than 3 data points.
+
+        Raises
+        ------
+        UnknownGroup
+            When the group is not in the dataset.
+
+        """
+        report = self.report
+        key = (geolocation, analyte)
+        if not statplot_options:
+            pdf = self.cache.get(key)
+            if pdf is not None:
+                return pdf
+
+        locations = report.locations
+        if key not in locations:
+            raise UnknownGroup(key)
+        loc = locations[key]
+
+        handle, filename = tempfile.mkstemp(suffix='.pdf')
+        os.close(handle)
+        try:
+            report._export_pdf(key, loc, filename, statplot_options)
+            with open(filename, 'rb') as output:
+                pdf = output.read()
+        finally:
+            os.remove(filename)
+
+        if not pdf:
+            return None
+
+        # the data may have changed while the report was made
+        if not statplot_options and report is self._report:
+            self.cache.put(key, pdf)
+        return pdf
+
+
+class _ReportRequestHandler(BaseHTTPRequestHandler):
+    """ Serves ``GET /report?geolocation=...&analyte=...``.
+    """
+
+    service = None
+
+    def _send(self, status, body, content_type='text/plain; charset=utf-8'):
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/report':
+            return self._send(404, 'Not found\n')
+
+        query = parse_qs(url.query)
+        if 'geolocation' not in query or 'analyte' not in query:
+            return self._send(400, 'Both geolocation and analyte are required\n')
+
+        geolocation = query['geolocation'][0]
+        analyte = query['analyte'][0]
+        try:
+            pdf = self.service.render(geolocation, analyte)
+        except UnknownGroup:
+            return self._send(404, '{} - {} is not in the dataset\n'.format(geolocation, analyte))
+        except Exception as e:
+            # keep serving, but tell the client rather than dropping
+            # the connection
+            logger.exception('Failed to create the report of %s - %s', geolocation, analyte)
+            return self.send_error(500, 'Failed to create the report', explain=str(e))
+
+        if pdf is None:
+            return self._send(404, '{} - {} does not have at least 3 data points\n'
+                                   .format(geolocation, analyte))
+        return self._send(200, pdf, content_type='application/pdf')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def make_server(service, host='127.0.0.1', port=8000):
+    """ HTTP server of the reports of a ReportService.
+
+    Parameters
+    ----------
+    service : ReportService
+    host : str (default = '127.0.0.1')
+    port : int (default = 8000)
+        Use 0 to pick any free port.
+
+    Returns
+    -------
+    server : http.server.HTTPServer
+        Call ``server.serve_forever()`` to start serving.
+
+    """
+    handler = type('ReportRequestHandler', (_ReportRequestHandler,), {'service': service})
+    return _ThreadingHTTPServer((host, port), handler)
+
+
+def serve(path, host='127.0.0.1', port=8000, maxsize=128, **report_options):
+    """ Serves the reports of a dataset until interrupted.
+
+    Parameters
+    ----------
+    path : str
+        Filepath to the CSV file containing input data.
+    host : str (default = '127.0.0.1')
+    port : int (default = 8000)
+    maxsize : int (default = 128)
+        Number of PDFs kept in the cache.
+    report_options : optional keyword arguments
+        Options passed directly to PdfReport.
+
+    """
+    service = ReportService(path, maxsize=maxsize, **report_options)
+    service.warm()
+
+    server = make_server(service, host=host, port=port)
+    print('Serving reports of {} on http://{}:{}/report'.format(path, host, server.server_port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+
+_ALIGNMENT = 64
+
+
+def _aligned(nbytes):
+    return -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+
+
+class SharedDataset(object):
+    """ The data and groups of a GroupIndex published in a single block
+    of shared memory, so that other processes can build the groups'
+    data without copying or re-reading the whole dataset.
+
+    Numeric columns are stored as they are and the other columns as
+    integer codes of their (pickled) unique values. The groups of each
+    combination of columns are stored as bounds into the sorted data
+    or into an array of positions. ``SharedDataset`` offers the
+    ``groups`` and ``frame`` methods of ``GroupIndex`` so that it can
+    take its place in a worker process.
+
+    Use ``SharedDataset.publish`` in the parent process and pass the
+    (small, picklable) ``handle`` to the workers, which call
+    ``SharedDataset.attach``.
+
+    """
+
+    def __init__(self, handle, block, owner=False):
+        self.handle = handle
+        self._block = block
+        self._owner = owner
+
+        self.nrows = handle['nrows']
+        self.columns = [spec['name'] for spec in handle['columns']]
+        self.labels = {}
+        self.arrays = {}
+        for spec in handle['columns']:
+            self.arrays[spec['name']] = self._array(spec['array'])
+            if spec['labels'] is not None:
+                # code -1 (missing) picks the trailing NaN
+                labels = np.empty(len(spec['labels']) + 1, dtype=object)
+                labels[:-1] = spec['labels']
+                labels[-1] = np.nan
+                self.labels[spec['name']] = labels
+
+        self._groups = {}
+
+    def _array(self, spec):
+        offset, shape, dtype = spec
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self._block.buf,
+                          offset=offset)
+
+    @classmethod
+    def publish(cls, index, groupings):
+        """ Copies the data and groups of a GroupIndex into a new block
+        of shared memory.
+
+        Parameters
+        ----------
+        index : GroupIndex
+            The grouped data.
+        groupings : list of lists of str
+            The combinations of columns whose groups are published.
+
+        Returns
+        -------
+        dataset : SharedDataset
+            Owner of the block, which is released by ``close`` (or at
+            the end of a ``with`` statement).
+
+        """
+        if shared_memory is None:
+            raise RuntimeError('Sharing the data between processes requires '
+                               'multiprocessing.shared_memory (Python 3.8+)')
+
+        arrays = []
+        columns = []
+        for name in index.data.columns:
+            values = index.data[name]
+            if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                array, labels = np.asarray(values), None
+            else:
+                array, labels = pd.factorize(values)
+                array, labels = array.astype(np.int32), list(labels)
+            columns.append({'name': name, 'labels': labels})
+            arrays.append(np.ascontiguousarray(array))
+
+        groups = []
+        for grouping in groupings:
+            found = index.groups(grouping)
+            rows = list(found.values())
+            if all(isinstance(r, slice) for r in rows):
+                bounds = [[r.start, r.stop] for r in rows]
+                positions = None
+            else:
+                stops = np.cumsum([len(r) for r in rows])
+                bounds = np.column_stack([stops - [len(r) for r in rows], stops])
+                positions = np.concatenate(rows) if rows else np.empty(0)
+                arrays.append(positions.astype(np.int64))
+            arrays.append(np.asarray(bounds, dtype=np.int64).reshape(-1, 2))
+            groups.append({'columns': tuple(grouping), 'keys': list(found.keys()),
+                           'positions': positions is not None})
+
+        specs = []
+        size = 0
+        for array in arrays:
+            specs.append((size, array.shape, array.dtype.str))
+            size += _aligned(array.nbytes)
+
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for array, (offset, shape, dtype) in zip(arrays, specs):
+            view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+            view[...] = array
+            del view
+
+        specs = iter(specs)
+        for column in columns:
+            column['array'] = next(specs)
+        for group in groups:
+            group['positions'] = next(specs) if group['positions'] else None
+            group['bounds'] = next(specs)
+
+        handle = {
+            'name': block.name,
+            'nrows': index.data.shape[0],
+            'columns': columns,
+            'groups': groups,
+        }
+        return cls(handle, block, owner=True)
+
+    @classmethod
+    def attach(cls, handle):
+        """ Attaches to a block published by another process.
+
+        Parameters
+        ----------
+        handle : dict
+            The ``handle`` of the published SharedDataset.
+
+        Returns
+        -------
+        dataset : SharedDataset
+
+        """
+        try:
+            # the publishing process is responsible for unlinking it
+            block = shared_memory.SharedMemory(name=handle['name'], track=False)
+        except TypeError:
+            block = shared_memory.SharedMemory(name=handle['name'])
+        return cls(handle, block, owner=False)
+
+    def groups(self, columns):
+        """ Rows of each group of a published combination of columns,
+        as returned by ``GroupIndex.groups``.
+        """
+        columns = tuple(columns)
+        if columns not in self._groups:
+            specs = [g for g in self.handle['groups'] if g['columns'] == columns]
+            if not specs:
+                raise ValueError('The groups of {} were not published'.format(list(columns)))
+            spec = specs[0]
+
+            bounds = self._array(spec['bounds'])
+            if spec['positions'] is None:
+                rows = [slice(int(start), int(stop)) for start, stop in bounds]
+            else:
+                positions = self._array(spec['positions'])
+                rows = [positions[start:stop] for start, stop in bounds]
+            self._groups[columns] = dict(zip(spec['keys'], rows))
+        return self._groups[columns]
+
+    def frame(self, rows):
+        """ The data of a group, as returned by ``groups``.
+        """
+        data = {}
+        for name in self.columns:
+            values = self.arrays[name][rows]
+            if name in self.labels:
+                values = self.labels[name][values]
+            data[name] = values
+        return pd.DataFrame(data, columns=self.columns)
+
+    def close(self):
+        """ Releases the block, and removes it when this is the
+        publishing process.
+        """
+        if self._block is None:
+            return
+        self.arrays = {}
+        self._groups = {}
+        self._block.close()
+        if self._owner:
+            self._block.unlink()
+        self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
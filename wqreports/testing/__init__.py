@@ -0,0 +1,10 @@
+def stub_converter(html, savename, css=None):
+    """ Stands in for pdfkit.from_string in the tests, writing the html
+    to ``savename`` without calling wkhtmltopdf. Module-level so that
+    worker processes can unpickle it.
+    """
+    if css is not None:
+        css.read()
+    with open(savename, 'w') as output:
+        output.write(html)
+    return True
@@ -1 +1,11 @@
 from .test_pdfreports import *
+from .test_bootstrap import *
+from .test_journal import *
+from .test_cache import *
+from .test_memory import *
+from .test_scheduler import *
+from .test_groups import *
+from .test_service import *
+from .test_intervals import *
+from .test_shared import *
+from .test_descriptive import *
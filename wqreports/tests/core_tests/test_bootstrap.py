@@ -0,0 +1,141 @@
+import nose.tools as nt
+import numpy as np
+import numpy.testing as nptest
+
+from wqreports.core import bootstrap
+
+
+class Base_Bootstrap_Mixin(object):
+    def setup(self):
+        self.data = np.array([
+            0.38320585, 0.75877428, 0.75050629, 0.29815660, 0.73783721,
+            0.09132073, 0.53183929, 0.21272010, 0.82763004, 0.70941756,
+            0.74860360, 0.51875550, 0.04766150, 0.66620810, 0.02767590,
+            0.15350380, 0.60390800, 0.73877040, 0.27760450, 0.35233220,
+        ])
+        self.rng = np.random.RandomState(0)
+
+
+class test_BCA(Base_Bootstrap_Mixin):
+    def test_bounds_bracket_statistic(self):
+        for statfxn in [np.mean, np.median]:
+            CI = bootstrap.BCA(self.data, statfxn, niter=1000, rng=self.rng)
+            nt.assert_equal(CI.shape, (2,))
+            nt.assert_less(CI[0], statfxn(self.data))
+            nt.assert_greater(CI[1], statfxn(self.data))
+
+    def test_rng_reproducible(self):
+        CI1 = bootstrap.BCA(self.data, np.mean, niter=1000, rng=np.random.RandomState(1))
+        CI2 = bootstrap.BCA(self.data, np.mean, niter=1000, rng=np.random.RandomState(1))
+        nptest.assert_array_equal(CI1, CI2)
+
+
+class test_jackknife(Base_Bootstrap_Mixin):
+    def check_jackknife(self, data, statfxn):
+        known = [statfxn(np.delete(data, i)) for i in range(data.shape[0])]
+        nptest.assert_array_almost_equal(bootstrap._jackknife(data, statfxn), known)
+
+    def test_mean(self):
+        self.check_jackknife(self.data, np.mean)
+
+    def test_median(self):
+        # even and odd sizes, and ties
+        self.check_jackknife(self.data, np.median)
+        self.check_jackknife(self.data[:-1], np.median)
+        self.check_jackknife(np.round(self.data, 1), np.median)
+
+    def test_other_statistic(self):
+        self.check_jackknife(self.data, np.std)
+
+
+class test_resample(Base_Bootstrap_Mixin):
+    def test_chunks_same_as_whole(self):
+        known = bootstrap._resample(self.data, np.median, 1000, np.random.RandomState(2))
+        chunk = bootstrap.RESAMPLE_CHUNK
+        bootstrap.RESAMPLE_CHUNK = 7 * self.data.shape[0]
+        try:
+            chunked = bootstrap._resample(self.data, np.median, 1000, np.random.RandomState(2))
+        finally:
+            bootstrap.RESAMPLE_CHUNK = chunk
+        nptest.assert_array_equal(chunked, known)
+
+
+class test_adaptive_BCA(Base_Bootstrap_Mixin):
+    def test_stops_early(self):
+        CI, niter = bootstrap.adaptive_BCA(self.data, np.mean, tol=0.1, block=500,
+                                           maxiter=10000, rng=self.rng)
+        nt.assert_less(niter, 10000)
+        nt.assert_equal(niter % 500, 0)
+        nt.assert_less(CI[0], self.data.mean())
+        nt.assert_greater(CI[1], self.data.mean())
+
+    def test_respects_maxiter(self):
+        CI, niter = bootstrap.adaptive_BCA(self.data, np.mean, tol=0, block=300,
+                                           maxiter=1000, rng=self.rng)
+        nt.assert_equal(niter, 1000)
+
+    def test_constant_data(self):
+        CI, niter = bootstrap.adaptive_BCA(np.ones(10), np.mean, block=100, rng=self.rng)
+        nt.assert_equal(niter, 200)
+        nptest.assert_array_almost_equal(CI, [1, 1])
+
+    @nt.raises(ValueError)
+    def test_empty_block(self):
+        bootstrap.adaptive_BCA(self.data, np.mean, block=0, rng=self.rng)
+
+    @nt.raises(ValueError)
+    def test_negative_tol(self):
+        bootstrap.adaptive_BCA(self.data, np.mean, tol=-0.1, rng=self.rng)
+
+
+class test_conf_intervals(Base_Bootstrap_Mixin):
+    def test_keys(self):
+        intervals, iterations = bootstrap.conf_intervals(self.data, bsIter=1000, rng=self.rng)
+        nt.assert_set_equal(set(intervals.keys()), {'mean', 'median', 'logmean', 'geomean'})
+        nt.assert_dict_equal(iterations, {'mean': 1000, 'median': 1000, 'logmean': 1000})
+        nptest.assert_array_almost_equal(intervals['geomean'], np.exp(intervals['logmean']))
+
+    def test_adaptive(self):
+        intervals, iterations = bootstrap.conf_intervals(
+            self.data, bsIter=5000, tol=0.1, block=250, rng=self.rng)
+        for stat in ['mean', 'median', 'logmean']:
+            nt.assert_less_equal(iterations[stat], 5000)
+
+    def test_nonpositive_data(self):
+        data = self.data - 0.1
+        intervals, iterations = bootstrap.conf_intervals(data, bsIter=500, rng=self.rng)
+        nt.assert_true(intervals['logmean'] is None)
+        nt.assert_true(intervals['geomean'] is None)
+        nt.assert_equal(iterations['logmean'], 0)
+
+
+    def test_subset(self):
+        intervals, iterations = bootstrap.conf_intervals(
+            self.data, bsIter=500, rng=self.rng, stats=['median'])
+        nt.assert_set_equal(set(intervals.keys()), {'median'})
+        nt.assert_dict_equal(iterations, {'median': 500})
+
+
+class test_group_rng(Base_Bootstrap_Mixin):
+    def test_reproducible(self):
+        rng1 = bootstrap.group_rng(42, ('location1', 'analyte_a'))
+        rng2 = bootstrap.group_rng(42, ('location1', 'analyte_a'))
+        nptest.assert_array_equal(rng1.randint(0, 100, size=20),
+                                  rng2.randint(0, 100, size=20))
+
+    def test_independent_streams(self):
+        rng1 = bootstrap.group_rng(42, ('location1', 'analyte_a'))
+        rng2 = bootstrap.group_rng(42, ('location1', 'analyte_b'))
+        rng3 = bootstrap.group_rng(43, ('location1', 'analyte_a'))
+        draws = [rng.randint(0, 2**30, size=5) for rng in [rng1, rng2, rng3]]
+        nt.assert_false(np.array_equal(draws[0], draws[1]))
+        nt.assert_false(np.array_equal(draws[0], draws[2]))
+
+    def test_order_independent(self):
+        keys = [('location1', 'analyte_a'), ('location1', 'analyte_b')]
+        forward = [bootstrap.BCA(self.data, np.mean, niter=500,
+                                 rng=bootstrap.group_rng(7, k)) for k in keys]
+        backward = [bootstrap.BCA(self.data, np.mean, niter=500,
+                                  rng=bootstrap.group_rng(7, k)) for k in keys[::-1]]
+        nptest.assert_array_equal(forward[0], backward[1])
+        nptest.assert_array_equal(forward[1], backward[0])
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+from pkg_resources import resource_filename
+
+import nose.tools as nt
+import numpy as np
+import numpy.testing as nptest
+import pandas
+import pandas.util.testing as pdtest
+
+from wqreports.core import cache
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class test_cache(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'data.csv')
+        shutil.copy(resource_filename("wqreports.testing", "testdata.txt"), self.path)
+        self.cachefolder = os.path.join(self.folder, 'cache')
+        self.config = {'ndvals': ['U']}
+        self.data = pandas.read_csv(self.path)
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_default_folder(self):
+        nt.assert_equal(cache.default_folder(self.path),
+                        os.path.join(self.folder, '.wqreports_cache'))
+
+    def test_cache_key_stable(self):
+        nt.assert_equal(cache.cache_key(self.path, self.config),
+                        cache.cache_key(self.path, self.config))
+
+    def test_cache_key_config(self):
+        nt.assert_not_equal(cache.cache_key(self.path, self.config),
+                            cache.cache_key(self.path, {'ndvals': ['U', 'J']}))
+
+    def test_cache_key_content(self):
+        key = cache.cache_key(self.path, self.config)
+        with open(self.path, 'a') as data:
+            data.write('location1,analyte_a,0.5,,mg/L,0.8\n')
+        nt.assert_not_equal(key, cache.cache_key(self.path, self.config))
+
+    def test_cache_key_stamp(self):
+        key = cache.cache_key(self.path, self.config, folder=self.cachefolder)
+        stat = os.stat(self.path)
+
+        # same size and modification time: the content is not read again
+        with open(self.path, 'r+') as data:
+            data.write('L')
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        nt.assert_equal(key, cache.cache_key(self.path, self.config, folder=self.cachefolder))
+        nt.assert_not_equal(key, cache.cache_key(self.path, self.config))
+
+        # a new modification time: the content is hashed again
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        nt.assert_equal(cache.cache_key(self.path, self.config, folder=self.cachefolder),
+                        cache.cache_key(self.path, self.config))
+
+    def test_load_missing(self):
+        key = cache.cache_key(self.path, self.config)
+        nt.assert_true(cache.load(self.cachefolder, self.path, key) is None)
+
+    @nptest.dec.skipif(cache.feather is None)
+    def test_store_and_load(self):
+        key = cache.cache_key(self.path, self.config)
+        cache.store(self.cachefolder, self.path, key, self.data, categories=['analyte'])
+        data = cache.load(self.cachefolder, self.path, key)
+        nt.assert_equal(str(data['analyte'].dtype), 'category')
+        pdtest.assert_frame_equal(data.astype({'analyte': object}), self.data)
+
+    @nptest.dec.skipif(cache.feather is None)
+    def test_load_without_copy(self):
+        key = cache.cache_key(self.path, self.config)
+        numeric = pandas.DataFrame({'res': np.arange(1e5), 'threshold': 0.5})
+        cache.store(self.cachefolder, self.path, key, numeric)
+
+        # the numeric columns are views of the memory-mapped file: arrow
+        # allocates a few bytes of bookkeeping, not a copy of the data
+        allocated = pyarrow.total_allocated_bytes()
+        data = cache.load(self.cachefolder, self.path, key)
+        nt.assert_less(pyarrow.total_allocated_bytes() - allocated, 1024)
+        pdtest.assert_frame_equal(data, numeric)
+
+    @nptest.dec.skipif(cache.feather is None)
+    def test_store_replaces_stale(self):
+        cache.store(self.cachefolder, self.path, 'old', self.data)
+        cache.store(self.cachefolder, self.path, 'new', self.data)
+        nt.assert_list_equal(os.listdir(self.cachefolder), ['data.csv.new.feather'])
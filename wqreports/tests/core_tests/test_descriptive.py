@@ -0,0 +1,88 @@
+import nose.tools as nt
+import numpy as np
+import numpy.testing as nptest
+import pandas
+import scipy.stats as stats
+import wqio
+
+from wqreports.core import descriptive
+from wqreports.core.groups import GroupIndex
+
+
+class test_grouped_stats(object):
+    def setup(self):
+        rng = np.random.RandomState(0)
+        self.data = pandas.DataFrame({
+            'location': rng.choice(['A', 'B', 'C'], size=60),
+            'analyte': rng.choice(['x', 'y'], size=60),
+            'season': rng.choice(['summer', 'winter'], size=60),
+            'res': rng.lognormal(size=60),
+            'qual': rng.choice(['=', 'ND'], size=60, p=[0.8, 0.2]),
+        })
+        # one group that is not strictly positive
+        self.data.loc[(self.data['location'] == 'C') & (self.data['analyte'] == 'y'), 'res'] -= 1
+        self.index = GroupIndex(self.data, ['location', 'analyte', 'season'])
+        self.values = self.index.data['res']
+        self.censored = self.index.data['qual'] == 'ND'
+
+    def check_stats(self, columns):
+        groups = self.index.groups(columns)
+        results = descriptive.grouped_stats(self.values, self.censored, groups)
+        nt.assert_list_equal(list(results.keys()), list(groups.keys()))
+
+        for key, rows in groups.items():
+            frame = self.index.frame(rows)
+            x = frame['res'].values
+            result = results[key]
+            nt.assert_equal(result.N, x.shape[0])
+            nt.assert_equal(result.ND, (frame['qual'] == 'ND').sum())
+            nptest.assert_almost_equal(result.min, x.min())
+            nptest.assert_almost_equal(result.max, x.max())
+            nptest.assert_almost_equal(result.mean, x.mean())
+            nptest.assert_almost_equal(result.std, np.std(x))
+            nptest.assert_almost_equal(result.cov, np.std(x) / x.mean())
+            nptest.assert_almost_equal(result.skew, stats.skew(x))
+            nptest.assert_almost_equal(result.median, np.median(x))
+            nptest.assert_almost_equal(result.pctl25, np.percentile(x, 25))
+            nptest.assert_almost_equal(result.pctl75, np.percentile(x, 75))
+            if x.min() > 0:
+                nptest.assert_almost_equal(result.logmean, np.log(x).mean())
+                nptest.assert_almost_equal(result.logstd, np.log(x).std())
+                nptest.assert_almost_equal(result.geomean, np.exp(np.log(x).mean()))
+            else:
+                nt.assert_true(result.logmean is None)
+                nt.assert_true(result.logstd is None)
+                nt.assert_true(result.geomean is None)
+
+    def test_same_as_wqio(self):
+        groups = self.index.groups(['location', 'analyte'])
+        results = descriptive.grouped_stats(self.values, self.censored, groups)
+        for key, rows in groups.items():
+            loc = wqio.features.Location(self.index.frame(rows), rescol='res',
+                                         qualcol='qual', ndval='ND', useROS=False)
+            for field in descriptive.FIELDS:
+                known = getattr(loc, field)
+                result = getattr(results[key], field)
+                if known is None:
+                    nt.assert_true(result is None, (key, field))
+                else:
+                    nptest.assert_almost_equal(result, known, err_msg=str((key, field)))
+
+    def test_contiguous_groups(self):
+        self.check_stats(['location', 'analyte'])
+
+    def test_positional_groups(self):
+        self.check_stats(['analyte', 'season'])
+
+    def test_not_positive(self):
+        results = descriptive.grouped_stats(
+            self.values, self.censored, self.index.groups(['location', 'analyte']))
+        nt.assert_true(results[('C', 'y')].logmean is None)
+
+    def test_single_value(self):
+        results = descriptive.grouped_stats([2.0], [False], {('A',): slice(0, 1)})
+        nt.assert_equal(results[('A',)].median, 2.0)
+        nt.assert_equal(results[('A',)].std, 0.0)
+
+    def test_empty(self):
+        nt.assert_dict_equal(descriptive.grouped_stats([], [], {}), {})
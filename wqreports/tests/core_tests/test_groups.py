@@ -0,0 +1,77 @@
+import nose.tools as nt
+import numpy as np
+import numpy.testing as nptest
+import pandas
+import pandas.util.testing as pdtest
+
+from wqreports.core.groups import GroupIndex, sort_groups
+
+
+class test_GroupIndex(object):
+    def setup(self):
+        self.data = pandas.DataFrame({
+            'location': ['B', 'A', 'B', 'A', 'A', 'B', None, 'A'],
+            'season': ['summer', 'winter', 'winter', 'summer', 'winter', 'summer', 'winter', 'summer'],
+            'analyte': ['x', 'x', 'y', 'y', 'x', 'x', 'x', 'y'],
+            'res': np.arange(8, dtype=float),
+        })
+        self.index = GroupIndex(self.data, ['location', 'analyte', 'season'])
+
+    def check_groups(self, columns):
+        groups = self.index.groups(columns)
+        known = {
+            key if isinstance(key, tuple) else (key,): rows
+            for key, rows in self.data.groupby(columns).groups.items()
+        }
+        nt.assert_set_equal(set(groups.keys()), set(known.keys()))
+        for key, rows in groups.items():
+            frame = self.index.frame(rows)
+            nt.assert_list_equal(sorted(frame.index), sorted(known[key]))
+            pdtest.assert_frame_equal(frame.sort_index(), self.data.loc[known[key]].sort_index())
+
+    def test_leading_columns_are_slices(self):
+        groups = self.index.groups(['location', 'analyte'])
+        for rows in groups.values():
+            nt.assert_true(isinstance(rows, slice))
+        self.check_groups(['location', 'analyte'])
+
+    def test_permuted_leading_columns(self):
+        groups = self.index.groups(['analyte', 'location'])
+        for rows in groups.values():
+            nt.assert_true(isinstance(rows, slice))
+        self.check_groups(['analyte', 'location'])
+
+    def test_other_columns(self):
+        self.check_groups(['season', 'analyte'])
+        self.check_groups(['season'])
+
+    def test_all_columns(self):
+        self.check_groups(['location', 'season', 'analyte'])
+
+    def test_missing_values_dropped(self):
+        groups = self.index.groups(['location'])
+        nt.assert_set_equal(set(groups.keys()), {('A',), ('B',)})
+
+    def test_numeric_keys_are_python_values(self):
+        index = GroupIndex(self.data.assign(year=[2014, 2015] * 4), ['year'])
+        keys = list(index.groups(['year']).keys())
+        nt.assert_list_equal(keys, [(2014,), (2015,)])
+        nt.assert_true(all(type(year) is int for year, in keys))
+
+    def test_groups_cached(self):
+        nt.assert_true(self.index.groups(['season']) is self.index.groups(['season']))
+
+    @nt.raises(ValueError)
+    def test_unknown_column(self):
+        self.index.groups(['landuse'])
+
+    def test_sorted_data_not_copied(self):
+        columns = ['location', 'analyte', 'season']
+        data = sort_groups(self.data, columns)
+        nt.assert_true(sort_groups(data, columns) is data)
+
+        index = GroupIndex(data, columns)
+        nt.assert_true(index.data is data)
+        pdtest.assert_frame_equal(index.data, self.index.data)
+        for col in columns:
+            nptest.assert_array_equal(index.codes[col], self.index.codes[col])
@@ -0,0 +1,90 @@
+import nose.tools as nt
+import numpy as np
+import numpy.testing as nptest
+
+from wqreports.core import intervals
+
+
+class Base_Intervals_Mixin(object):
+    def setup(self):
+        self.data = np.array([
+            0.38320585, 0.75877428, 0.75050629, 0.29815660, 0.73783721,
+            0.09132073, 0.53183929, 0.21272010, 0.82763004, 0.70941756,
+            0.10518113, 0.32093432, 0.54468432, 0.99437640, 0.36391310,
+            0.12876702, 0.43190380, 0.66052232, 0.25702862, 0.47209154,
+        ])
+        self.rng = np.random.RandomState(0)
+
+
+class test_t_interval(Base_Intervals_Mixin):
+    def test_bounds(self):
+        CI = intervals.t_interval(self.data)
+        nptest.assert_array_almost_equal(CI, [0.35593722, 0.60214383])
+
+    def test_contains_mean(self):
+        CI = intervals.t_interval(self.data)
+        nt.assert_less(CI[0], self.data.mean())
+        nt.assert_greater(CI[1], self.data.mean())
+
+
+class test_binomial_interval(Base_Intervals_Mixin):
+    def test_order_statistics(self):
+        # x_(6) and x_(15) for N = 20 at 95% confidence
+        sorted_data = np.sort(self.data)
+        CI = intervals.binomial_interval(self.data)
+        nptest.assert_array_equal(CI, [sorted_data[5], sorted_data[14]])
+
+    def test_too_few_values(self):
+        CI = intervals.binomial_interval(self.data[:4])
+        nptest.assert_array_equal(CI, [self.data[:4].min(), self.data[:4].max()])
+
+
+class test_lognormal_interval(Base_Intervals_Mixin):
+    def test_geomean(self):
+        logmean, geomean = intervals.lognormal_interval(self.data)
+        nptest.assert_array_almost_equal(logmean, intervals.t_interval(np.log(self.data)))
+        nptest.assert_array_almost_equal(geomean, np.exp(logmean))
+
+
+class test_resolve_methods(object):
+    def test_default(self):
+        nt.assert_dict_equal(intervals.resolve_methods(),
+                             {'mean': 'bootstrap', 'median': 'bootstrap',
+                              'geomean': 'bootstrap'})
+
+    def test_analytic(self):
+        nt.assert_dict_equal(intervals.resolve_methods('analytic'),
+                             {'mean': 't', 'median': 'binomial',
+                              'geomean': 'lognormal'})
+
+    def test_partial(self):
+        nt.assert_dict_equal(intervals.resolve_methods({'median': 'analytic'}),
+                             {'mean': 'bootstrap', 'median': 'binomial',
+                              'geomean': 'bootstrap'})
+
+    @nt.raises(ValueError)
+    def test_bad_method(self):
+        intervals.resolve_methods({'mean': 'binomial'})
+
+    @nt.raises(ValueError)
+    def test_bad_statistic(self):
+        intervals.resolve_methods({'mode': 't'})
+
+
+class test_conf_intervals(Base_Intervals_Mixin):
+    def test_analytic(self):
+        CIs, iterations = intervals.conf_intervals(self.data, methods='analytic')
+        nt.assert_dict_equal(iterations, {'mean': 0, 'median': 0, 'logmean': 0})
+        nptest.assert_array_almost_equal(CIs['mean'], intervals.t_interval(self.data))
+        nptest.assert_array_almost_equal(CIs['geomean'], np.exp(CIs['logmean']))
+
+    def test_mixed(self):
+        CIs, iterations = intervals.conf_intervals(
+            self.data, methods={'median': 'binomial'}, bsIter=500, rng=self.rng)
+        nt.assert_dict_equal(iterations, {'mean': 500, 'median': 0, 'logmean': 500})
+        nptest.assert_array_equal(CIs['median'], intervals.binomial_interval(self.data))
+
+    def test_nonpositive_data(self):
+        CIs, iterations = intervals.conf_intervals(self.data - 0.1, methods='analytic')
+        nt.assert_true(CIs['logmean'] is None)
+        nt.assert_true(CIs['geomean'] is None)
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+
+import nose.tools as nt
+
+from wqreports.core.journal import Journal
+
+
+class test_Journal(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'journal.jsonl')
+        self.journal = Journal(self.path)
+        self.pdf_a = os.path.join(self.folder, 'a.pdf')
+        self.pdf_b = os.path.join(self.folder, 'b.pdf')
+        with open(self.pdf_a, 'w') as pdf:
+            pdf.write('pdf')
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_empty(self):
+        nt.assert_dict_equal(self.journal.entries, {})
+        nt.assert_set_equal(self.journal.completed(), set())
+
+    def test_record(self):
+        self.journal.record(('location1', 'analyte_a'), self.pdf_a, Journal.DONE)
+        self.journal.record(('location1', 'analyte_b'), self.pdf_b, Journal.FAILED, error='boom')
+        nt.assert_set_equal(self.journal.completed(), {('location1', 'analyte_a')})
+        nt.assert_dict_equal(self.journal.failed(), {('location1', 'analyte_b'): 'boom'})
+
+    def test_latest_entry_wins(self):
+        key = ('location1', 'analyte_a')
+        self.journal.record(key, self.pdf_a, Journal.FAILED, error='boom')
+        self.journal.record(key, self.pdf_a, Journal.DONE)
+        nt.assert_set_equal(Journal(self.path).completed(), {key})
+        nt.assert_dict_equal(Journal(self.path).failed(), {})
+
+    def test_skipped(self):
+        self.journal.record(('location1', 'analyte_b'), self.pdf_b, Journal.SKIPPED)
+        nt.assert_set_equal(self.journal.completed(), set())
+        nt.assert_set_equal(self.journal.skipped(), {('location1', 'analyte_b')})
+
+    def test_missing_pdf_not_completed(self):
+        self.journal.record(('location1', 'analyte_b'), self.pdf_b, Journal.DONE)
+        nt.assert_set_equal(self.journal.completed(), set())
+
+    def test_truncated_line(self):
+        self.journal.record(('location1', 'analyte_a'), self.pdf_a, Journal.DONE)
+        with open(self.path, 'a') as journal:
+            journal.write('{"key": ["location1", "ana')
+        nt.assert_set_equal(self.journal.completed(), {('location1', 'analyte_a')})
+
+        self.journal.record(('location1', 'analyte_b'), self.pdf_b, Journal.FAILED, error='boom')
+        nt.assert_dict_equal(self.journal.failed(), {('location1', 'analyte_b'): 'boom'})
@@ -0,0 +1,134 @@
+import os
+import gc
+import functools
+import shutil
+import tempfile
+import tracemalloc
+from pkg_resources import resource_filename
+
+import nose.tools as nt
+import numpy as np
+import numpy.testing as nptest
+
+from wqreports import core
+from wqreports.testing import stub_converter
+
+
+# the full leak checks take minutes: they only run when opted in with
+# WQREPORTS_MEMORY_TESTS=1 (as on Travis)
+SKIP_MEMORY_TESTS = os.environ.get('WQREPORTS_MEMORY_TESTS', '') in ('', '0')
+SKIP_MESSAGE = 'set WQREPORTS_MEMORY_TESTS=1 to run the leak checks'
+
+N_WARMUP = 50
+N_REPORTS = 300
+SAMPLE_EVERY = 25
+
+N_QUICK_WARMUP = 5
+N_QUICK_REPORTS = 10
+
+# tolerated growth per report, in bytes
+MAX_TRACED_GROWTH = 2 * 1024
+MAX_RSS_GROWTH = 32 * 1024
+# a leaked figure or Location is hundreds of kB
+MAX_QUICK_GROWTH = 50 * 1024
+
+
+def _rss():
+    """ Resident set size of the process in bytes, or None where
+    /proc is not available.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as statm:
+            pages = int(statm.read().split()[1])
+    except (IOError, OSError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def _growth_report(stats, limit=10):
+    lines = ['Top growing allocation sites:']
+    for stat in stats[:limit]:
+        lines.append('    {}'.format(stat))
+    return '\n'.join(lines)
+
+
+class test_MemoryLeaks(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.savename = os.path.join(self.folder, 'report.pdf')
+        self.path = resource_filename("wqreports.testing", "testdata.txt")
+        self.report = core.PdfReport(self.path, bsIter=1000, converter=stub_converter)
+        self.locations = list(self.report.locations.items())
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def make_reports(self, N):
+        for n in range(N):
+            (geolocation, analyte), loc = self.locations[n % len(self.locations)]
+            core.pdfreport.make_report(loc, self.savename, analyte=analyte,
+                                       geolocation=geolocation, statplot_options={},
+                                       converter=stub_converter)
+
+    def export_reports(self, report, N):
+        # each export produces every report of the dataset. Sequential,
+        # because matplotlib caches its fonts per thread (up to a bound)
+        # and every export starts new threads
+        for n in range(0, N, len(self.locations)):
+            report.export_pdfs(self.folder)
+
+    def check_traced_growth(self, make_reports, warmup, N, limit):
+        make_reports(warmup)
+        gc.collect()
+
+        # the growth is compared by line, which only needs the innermost
+        # frame (and tracing more frames makes the reports much slower)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            make_reports(N)
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = (after.filter_traces(filters)
+                      .compare_to(before.filter_traces(filters), 'lineno'))
+        growth = sum(stat.size_diff for stat in stats)
+        nt.assert_less(growth / N, limit, _growth_report(stats))
+
+    @nptest.dec.skipif(SKIP_MEMORY_TESTS, SKIP_MESSAGE)
+    def test_traced_allocations_flat(self):
+        self.check_traced_growth(self.make_reports, N_WARMUP, N_REPORTS,
+                                 MAX_TRACED_GROWTH)
+
+    @nptest.dec.skipif(_rss() is None)
+    @nptest.dec.skipif(SKIP_MEMORY_TESTS, SKIP_MESSAGE)
+    def test_rss_flat(self):
+        self.make_reports(N_WARMUP)
+        gc.collect()
+
+        samples = []
+        for n in range(0, N_REPORTS, SAMPLE_EVERY):
+            self.make_reports(SAMPLE_EVERY)
+            gc.collect()
+            samples.append(_rss())
+
+        reports = np.arange(1, len(samples) + 1) * SAMPLE_EVERY
+        slope = np.polyfit(reports, samples, 1)[0]
+        nt.assert_less(slope, MAX_RSS_GROWTH,
+                       'RSS grows by {:.0f} bytes per report: {}'.format(slope, samples))
+
+    @nptest.dec.skipif(SKIP_MEMORY_TESTS, SKIP_MESSAGE)
+    def test_export_traced_allocations_flat(self):
+        # fewer iterations, since every export computes the intervals
+        report = core.PdfReport(self.path, bsIter=100, converter=stub_converter)
+        export = functools.partial(self.export_reports, report)
+        self.check_traced_growth(export, N_WARMUP, N_REPORTS, MAX_TRACED_GROWTH)
+
+    def test_traced_allocations_quick(self):
+        # always on: a few reports catch a leak of the size of a figure
+        # or a Location, the opt-in checks above catch the slow ones
+        self.check_traced_growth(self.make_reports, N_QUICK_WARMUP, N_QUICK_REPORTS,
+                                 MAX_QUICK_GROWTH)
@@ -1,16 +1,64 @@
 import os
 import sys
+import copy
+import functools
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
 from pkg_resources import resource_filename
 
 import nose.tools as nt
 import numpy as np
 import numpy.testing as nptest
+import matplotlib
+import matplotlib.axes
+import matplotlib.figure
 import pandas
 import pandas.util.testing as pdtest
 
 from wqio import Location
 
 from wqreports import core
+from wqreports.testing import stub_converter
+
+
+def blocking_converter(html, savename, css=None, first=None, started=None,
+                       release=None):
+    """ Fails on the report of the ``first`` location once another
+    report has started. The other reports are written once ``release``
+    is set.
+    """
+    if os.path.basename(savename).startswith(first):
+        if not started.wait(10):
+            raise RuntimeError('no other report started')
+        raise OSError('the pdf is open')
+    started.set()
+    if not release.wait(10):
+        raise RuntimeError('the report was never released')
+    with open(savename, 'w') as output:
+        output.write(html)
+    return True
+
+
+@nt.nottest
+def record_notches(report, key, filename):
+    """ (cilo, cihi) of the box plots drawn while exporting the report
+    of a group.
+    """
+    notches = []
+    bxp = matplotlib.axes.Axes.bxp
+
+    def recording_bxp(ax, bxpstats, *args, **kwargs):
+        notches.extend((stats['cilo'], stats['cihi']) for stats in bxpstats)
+        return bxp(ax, bxpstats, *args, **kwargs)
+
+    with mock.patch.object(matplotlib.axes.Axes, 'bxp', recording_bxp):
+        report._export_pdf(key, report.locations[key], filename, {})
+    return notches
+
 
 @nt.nottest
 class mock_location(object):
@@ -61,6 +109,75 @@ def test_make_table():
     pdtest.assert_frame_equal(dataframe[cols], known_dataframe[cols])
 
 
+def test_make_table_intervals():
+    intervals = {
+        'mean': (0.1, 0.2),
+        'median': (0.3, 0.4),
+        'logmean': None,
+        'geomean': None,
+    }
+    iterations = {'mean': 1500, 'median': 2000, 'logmean': 0}
+    dataframe = core.make_table(mock_location(), intervals=intervals,
+                                iterations=iterations)
+    nt.assert_equal(dataframe.loc[3, 'Result'], '0.560\n(0.100; 0.200)')
+    nt.assert_equal(dataframe.loc[5, 'Result'], '0.450\n(-; -)')
+    nt.assert_equal(dataframe.loc[10, 'Result'], '0.510\n(0.300; 0.400)')
+    nt.assert_equal(dataframe.iloc[-1]['Result'], '1500; 2000; 0')
+
+
+def test_make_table_methods():
+    intervals = {
+        'mean': (0.1, 0.2),
+        'median': (0.3, 0.4),
+        'logmean': (-1.0, -0.5),
+        'geomean': (0.37, 0.61),
+    }
+    methods = {'mean': 't', 'median': 'binomial', 'geomean': 'bootstrap'}
+    dataframe = core.make_table(mock_location(), intervals=intervals, methods=methods)
+    nt.assert_equal(dataframe.loc[3, 'Statistic'],
+                    'Mean (mg/L)\n(95% confidence interval,\nt-interval)')
+    nt.assert_equal(dataframe.loc[10, 'Statistic'],
+                    'Median (mg/L)\n(95% confidence interval,\norder statistics)')
+    nt.assert_equal(dataframe.loc[7, 'Statistic'],
+                    'Geo. Mean (mg/L)\n(95% confidence interval,\nBCA bootstrap)')
+
+
+
+def test_make_table_descriptives():
+    descriptives = core.pdfreport.descriptive.GroupStats(
+        N=5, ND=1, min=0.1, max=0.9, mean=0.4, std=0.2, cov=0.5, skew=0.1,
+        median=0.3, pctl25=0.2, pctl75=0.6, logmean=None, logstd=None, geomean=None)
+    dataframe = core.make_table(mock_location(), descriptives=descriptives)
+    nt.assert_equal(dataframe.loc[0, 'Result'], '5.000')
+    nt.assert_equal(dataframe.loc[3, 'Result'], '0.400\n(0.370; 0.920)')
+    nt.assert_equal(dataframe.loc[7, 'Result'], '-\n(0.430; 0.720)')
+    nt.assert_equal(dataframe.loc[11, 'Result'], '0.200; 0.600')
+
+
+def test_report_style():
+    known_mew = matplotlib.rcParams['lines.markeredgewidth']
+    with core.pdfreport.report_style():
+        nt.assert_equal(matplotlib.rcParams['lines.markeredgewidth'], 0.5)
+        nt.assert_equal(matplotlib.rcParams['mathtext.default'], 'regular')
+    nt.assert_equal(matplotlib.rcParams['lines.markeredgewidth'], known_mew)
+
+
+def test_shared_style_nested():
+    known_mew = matplotlib.rcParams['lines.markeredgewidth']
+    with core.pdfreport._shared_style():
+        with core.pdfreport._shared_style():
+            nt.assert_equal(matplotlib.rcParams['lines.markeredgewidth'], 0.5)
+        # still applied for the outer user
+        nt.assert_equal(matplotlib.rcParams['lines.markeredgewidth'], 0.5)
+    nt.assert_equal(matplotlib.rcParams['lines.markeredgewidth'], known_mew)
+
+
+def test__legend_uri():
+    uri = core.pdfreport._legend_uri()
+    nt.assert_true(uri.startswith('data:image/png;base64,'))
+    nt.assert_true(core.pdfreport._legend_uri() is uri)
+
+
 
 class Base_PdfReport_Mixin(object):
     def test_filepath(self):
@@ -97,6 +214,27 @@ class Base_PdfReport_Mixin(object):
         nt.assert_true(isinstance(self.report.cleandata, pandas.DataFrame))
         pdtest.assert_frame_equal(self.report.cleandata, self.known_cleandata)
 
+    @nptest.dec.skipif(core.pdfreport.ingest_cache.feather is None)
+    def test_cleandata_cached(self):
+        folder = tempfile.mkdtemp()
+        try:
+            for _ in range(2):
+                report = core.PdfReport(self.path, cache=folder)
+                labels = {col: object for col in report._labelcols}
+                # stored in the order of the groups
+                known = (self.known_cleandata
+                             .sort_values(report._groupcolumns, kind='mergesort')
+                             .reset_index(drop=True))
+                pdtest.assert_frame_equal(report.cleandata.astype(labels),
+                                          known.astype(labels))
+                nt.assert_true(report.groups.data is report.cleandata)
+            cachefiles = [f for f in os.listdir(folder) if f.endswith('.feather')]
+            nt.assert_equal(len(cachefiles), 1)
+            nt.assert_list_equal(sorted(report.locations.keys()),
+                                 [('location1', 'analyte_a'), ('location1', 'analyte_b')])
+        finally:
+            shutil.rmtree(folder)
+
     def test_analytes(self):
         nt.assert_true(hasattr(self.report, 'analytes'))
         nt.assert_list_equal(self.report.analytes, self.known_analytes)
@@ -119,11 +257,444 @@ class Base_PdfReport_Mixin(object):
         # todo: rename
         loc = self.report._make_location("JUNK", "JUNK")
 
+    def test__conf_intervals_default(self):
+        key = ('location1', 'analyte_a')
+        intervals, iterations = self.report._conf_intervals(key, self.report.locations[key])
+        nt.assert_true(intervals is None)
+        nt.assert_true(iterations is None)
+
+    def test__conf_intervals_seeded(self):
+        key = ('location1', 'analyte_a')
+        results = []
+        for _ in range(2):
+            report = core.PdfReport(self.path, bsIter=1000, seed=42)
+            results.append(report._conf_intervals(key, report.locations[key]))
+        nptest.assert_array_equal(results[0][0]['mean'], results[1][0]['mean'])
+        nptest.assert_array_equal(results[0][0]['median'], results[1][0]['median'])
+        nt.assert_true(results[0][1] is None)
+
+    def test__export_pdf_seeded_notch(self):
+        key = ('location1', 'analyte_a')
+        folder = tempfile.mkdtemp()
+        try:
+            notches = []
+            for _ in range(2):
+                report = core.PdfReport(self.path, bsIter=1000, seed=42,
+                                        converter=stub_converter)
+                notches.append(record_notches(report, key, os.path.join(folder, 'report.pdf')))
+        finally:
+            shutil.rmtree(folder)
+        nt.assert_equal(len(notches[0]), 1)
+        nptest.assert_array_equal(notches[0], notches[1])
+
+    def test__conf_intervals_adaptive(self):
+        key = ('location1', 'analyte_a')
+        report = core.PdfReport(self.path, bsIter=2000, bsTol=0.05, bsBlock=250, seed=42)
+        intervals, iterations = report._conf_intervals(key, report.locations[key])
+        nt.assert_dict_equal(report.bsIterations[key], iterations)
+        nt.assert_less_equal(iterations['mean'], 2000)
+
+    def test__conf_intervals_analytic(self):
+        key = ('location1', 'analyte_a')
+        report = core.PdfReport(self.path, ciMethods='analytic')
+        intervals, iterations = report._conf_intervals(key, report.locations[key])
+        nptest.assert_array_almost_equal(
+            intervals['mean'], core.pdfreport.ci.t_interval(report.locations[key].data))
+        nt.assert_true(iterations is None)
+
+    @nt.raises(ValueError)
+    def test_bad_ciMethods(self):
+        core.PdfReport(self.path, ciMethods='jackknife')
+
+    def test__export_pdf_adaptive_notch(self):
+        key = ('location1', 'analyte_a')
+        report = core.PdfReport(self.path, bsIter=2000, bsTol=0.05, bsBlock=250, seed=42,
+                                converter=stub_converter)
+        intervals, iterations = report._conf_intervals(key, report.locations[key])
+        folder = tempfile.mkdtemp()
+        try:
+            notches = record_notches(report, key, os.path.join(folder, 'report.pdf'))
+        finally:
+            shutil.rmtree(folder)
+        nptest.assert_array_almost_equal(notches, [intervals['median']])
+
+    def test__export_pdf_analytic_without_bootstrap(self):
+        # wqio bootstraps these lazily, the analytic reports must not
+        bootstrapped = ['mean', 'median', 'mean_conf_interval', 'median_conf_interval',
+                        'logmean_conf_interval', 'geomean_conf_interval']
+
+        def forbidden(name):
+            def get(self):
+                raise AssertionError('{} was bootstrapped'.format(name))
+            return property(get)
+
+        key = ('location1', 'analyte_a')
+        report = core.PdfReport(self.path, ciMethods='analytic', converter=stub_converter)
+        StrictLocation = type('StrictLocation', (type(report.locations[key]),),
+                              {name: forbidden(name) for name in bootstrapped})
+        loc = copy.copy(report.locations[key])
+        loc.__class__ = StrictLocation
+        folder = tempfile.mkdtemp()
+        try:
+            nt.assert_true(report._export_pdf(key, loc, os.path.join(folder, 'report.pdf'), {}))
+        finally:
+            shutil.rmtree(folder)
+
+    def test__report_location_threads(self):
+        loc = self.report.locations[('location1', 'analyte_a')]
+        intervals = {'mean': (0.1, 0.2), 'median': (0.3, 0.4),
+                     'logmean': None, 'geomean': None}
+        views = []
+        start = threading.Barrier(8)
+
+        def make_view():
+            start.wait()
+            views.append(core.pdfreport._report_location(loc, intervals=intervals))
+
+        with mock.patch.dict(core.pdfreport._OVERRIDE_CLASSES, clear=True):
+            threads = [threading.Thread(target=make_view) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            nt.assert_equal(len(core.pdfreport._OVERRIDE_CLASSES), 1)
+        nt.assert_equal(len(set(type(view) for view in views)), 1)
+        nt.assert_equal(views[0].median_conf_interval, (0.3, 0.4))
+
+    def test_make_report_renders_concurrently(self):
+        # rendered once, beforehand, as it is cached
+        core.pdfreport._legend_uri()
+        both = threading.Barrier(2, timeout=10)
+        savefig = matplotlib.figure.Figure.savefig
+        styles = []
+
+        def waiting_savefig(fig, *args, **kwargs):
+            # fails (BrokenBarrierError) unless both threads are here
+            both.wait()
+            styles.append(matplotlib.rcParams['mathtext.default'])
+            return savefig(fig, *args, **kwargs)
+
+        errors = []
+        folder = tempfile.mkdtemp()
+
+        def export(key):
+            try:
+                core.pdfreport.make_report(self.report.locations[key],
+                                           os.path.join(folder, '{}.pdf'.format(key[1])),
+                                           statplot_options={}, converter=stub_converter)
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            with mock.patch.object(matplotlib.figure.Figure, 'savefig', waiting_savefig):
+                threads = [threading.Thread(target=export, args=(key,))
+                           for key in self.report.locations]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            shutil.rmtree(folder)
+        nt.assert_list_equal(errors, [])
+        nt.assert_list_equal(styles, ['regular', 'regular'])
+
+    def test_make_report_stats_outside_plot_lock(self):
+        # the first access computes the (lazy) interval, as in wqio
+        locked = []
+
+        class LazyLocation(type(self.report.locations[('location1', 'analyte_a')])):
+            @property
+            def median_conf_interval(self):
+                if not locked:
+                    locked.append(core.pdfreport._PLOT_LOCK.locked())
+                return (0.1, 0.2)
+
+        loc = copy.copy(self.report.locations[('location1', 'analyte_a')])
+        loc.__class__ = LazyLocation
+        folder = tempfile.mkdtemp()
+        try:
+            core.pdfreport.make_report(loc, os.path.join(folder, 'report.pdf'),
+                                       statplot_options={}, converter=stub_converter)
+        finally:
+            shutil.rmtree(folder)
+        nt.assert_list_equal(locked, [False])
+
+    def test_make_report_timings(self):
+        # a slow (lazy) interval is timed with the statistics, not the
+        # figures, whose time Progress assumes the same for every report
+        class SlowLocation(type(self.report.locations[('location1', 'analyte_a')])):
+            @property
+            def median_conf_interval(self):
+                if '_slow_interval' not in self.__dict__:
+                    time.sleep(0.5)
+                    self._slow_interval = (0.1, 0.2)
+                return self._slow_interval
+
+        loc = copy.copy(self.report.locations[('location1', 'analyte_a')])
+        loc.__class__ = SlowLocation
+        timings = {}
+        folder = tempfile.mkdtemp()
+        try:
+            core.pdfreport.make_report(loc, os.path.join(folder, 'report.pdf'),
+                                       statplot_options={}, converter=stub_converter,
+                                       timings=timings)
+        finally:
+            shutil.rmtree(folder)
+        nt.assert_greater_equal(timings['stats'], 0.5)
+
+    @nt.raises(ValueError)
+    def test_bad_bsBlock(self):
+        core.PdfReport(self.path, bsTol=0.01, bsBlock=0)
+
+    @nt.raises(ValueError)
+    def test_bad_bsTol(self):
+        core.PdfReport(self.path, bsTol=-0.01)
+
+    def test_groups(self):
+        nt.assert_list_equal(self.report.groups.columns, ['location', 'analyte'])
+
+    def test_family_locations(self):
+        locations = self.report.family_locations(['analyte'])
+        nt.assert_list_equal(sorted(locations.keys()), [('analyte_a',), ('analyte_b',)])
+        loc = locations[('analyte_a',)]
+        nt.assert_equal(loc.definition['analyte'], 'analyte_a')
+        pdtest.assert_frame_equal(
+            loc.raw_data, self.known_cleandata.query("analyte == 'analyte_a'"))
+
+    def test_families_jobs(self):
+        report = core.PdfReport(self.path, families={'location1': ['unit', 'analyte']})
+        nt.assert_list_equal(sorted(report._jobs().keys()), [
+            ('family', 'location1', 'mg/L', 'analyte_a'),
+            ('family', 'location1', 'mg/L', 'analyte_b'),
+            ('location1', 'analyte_a'), ('location1', 'analyte_b'),
+        ])
+        nt.assert_set_equal(set(report.estimate_costs().keys()), set(report._jobs().keys()))
+
+    @nt.raises(ValueError)
+    def test_families_without_analyte(self):
+        core.PdfReport(self.path, families={'bad': ['location']})
+
+    @nt.raises(ValueError)
+    def test_families_only_analyte(self):
+        core.PdfReport(self.path, families={'all': ['analyte']})
+
+    def test_estimate_costs(self):
+        costs = self.report.estimate_costs()
+        nt.assert_set_equal(set(costs.keys()), set(self.report.locations.keys()))
+        # analyte_a has 11 rows, analyte_b has 9
+        nt.assert_greater(costs[('location1', 'analyte_a')],
+                          costs[('location1', 'analyte_b')])
+
+    def test_group_stats(self):
+        descriptives = self.report.group_stats()
+        nt.assert_set_equal(set(descriptives.keys()), set(self.report.locations.keys()))
+        for key, loc in self.report.locations.items():
+            # every field is what the table would read from the Location
+            for field in core.pdfreport.descriptive.FIELDS:
+                known = getattr(loc, field)
+                result = getattr(descriptives[key], field)
+                if known is None:
+                    nt.assert_true(result is None, field)
+                else:
+                    nptest.assert_almost_equal(result, known, err_msg=field)
+
+    def test_group_stats_before_workers(self):
+        computed = []
+
+        def fake_export(key, loc, filename, statplot_options, timings=None):
+            computed.append(self.report._group_stats is not None)
+            return True
+
+        self.report._export_pdf = fake_export
+        folder = tempfile.mkdtemp()
+        try:
+            self.report.export_pdfs(folder, max_workers=2)
+        finally:
+            shutil.rmtree(folder)
+        nt.assert_list_equal(computed, [True, True])
+
+    def test_group_stats_ROS(self):
+        report = core.PdfReport(self.path, useROS=True)
+        nt.assert_dict_equal(report.group_stats(), {})
+
+    def test_export_pdfs_continue_and_resume(self):
+        folder = tempfile.mkdtemp()
+        calls = []
+
+        def fake_export(key, loc, filename, statplot_options, timings=None):
+            calls.append(key)
+            if key[1] == 'analyte_b':
+                raise OSError('the pdf is open')
+            with open(filename, 'w') as pdf:
+                pdf.write('pdf')
+            return True
+
+        try:
+            self.report._export_pdf = fake_export
+            failed = self.report.export_pdfs(folder, errors='continue')
+            nt.assert_list_equal(list(failed.keys()), [('location1', 'analyte_b')])
+            nt.assert_equal(len(calls), 2)
+
+            calls[:] = []
+            failed = self.report.export_pdfs(folder, resume=True, errors='continue')
+            nt.assert_list_equal(calls, [('location1', 'analyte_b')])
+        finally:
+            shutil.rmtree(folder)
+
+    @nt.raises(OSError)
+    def test_export_pdfs_raise(self):
+        folder = tempfile.mkdtemp()
+
+        def fake_export(key, loc, filename, statplot_options, timings=None):
+            raise OSError('the pdf is open')
+
+        try:
+            self.report._export_pdf = fake_export
+            self.report.export_pdfs(folder)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_export_pdfs_skipped(self):
+        folder = tempfile.mkdtemp()
+        calls = []
+
+        def fake_export(key, loc, filename, statplot_options, timings=None):
+            calls.append(key)
+            return False
+
+        try:
+            self.report._export_pdf = fake_export
+            self.report.export_pdfs(folder)
+            journal = core.journal.Journal(os.path.join(folder, 'wqreports_journal.jsonl'))
+            nt.assert_set_equal(journal.skipped(), set(self.report.locations.keys()))
+
+            calls[:] = []
+            self.report.export_pdfs(folder, resume=True)
+            nt.assert_list_equal(calls, [])
+        finally:
+            shutil.rmtree(folder)
+
     @nptest.dec.skipif(True)
     def test_export_pdfs_smoke_test(self):
         self.report.export_pdfs('.', 'test')
 
 
+@nt.nottest
+def write_sites(path, sites=10, N=5):
+    """ Writes a dataset of one analyte at many locations.
+    """
+    rng = np.random.RandomState(0)
+    data = pandas.DataFrame({
+        'location': np.repeat(['site{:02d}'.format(n) for n in range(sites)], N),
+        'analyte': 'analyte_a',
+        'res': rng.lognormal(size=sites * N),
+        'qual': '',
+        'unit': 'mg/L',
+        'threshold': 0.8,
+    })
+    data.to_csv(path, index=False)
+
+
+class test_export_pdfs_families(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'sites.csv')
+        write_sites(self.path, sites=2, N=6)
+        data = pandas.read_csv(self.path)
+        data['year'] = np.tile([2014, 2015], data.shape[0] // 2)
+        data.to_csv(self.path, index=False)
+        self.report = core.PdfReport(self.path, families={'yearly': ['year', 'analyte']},
+                                     ciMethods='analytic', converter=stub_converter)
+        self.journal = os.path.join(self.folder, 'journal.jsonl')
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_numeric_family_journaled(self):
+        failed = self.report.export_pdfs(self.folder, journal=self.journal)
+        nt.assert_dict_equal(failed, {})
+
+        journal = core.journal.Journal(self.journal)
+        nt.assert_set_equal(journal.completed(), {
+            ('site00', 'analyte_a'), ('site01', 'analyte_a'),
+            ('family', 'yearly', 2014, 'analyte_a'),
+            ('family', 'yearly', 2015, 'analyte_a'),
+        })
+        written = sorted(f for f in os.listdir(self.folder) if f.endswith('.pdf'))
+        nt.assert_list_equal(written, [
+            'family-yearly-2014analyte_a.pdf', 'family-yearly-2015analyte_a.pdf',
+            'site00analyte_a.pdf', 'site01analyte_a.pdf',
+        ])
+
+
+class test_export_pdfs_raise_stops(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'sites.csv')
+        write_sites(self.path)
+        self.report = core.PdfReport(self.path, ciMethods='analytic')
+        self.journal = os.path.join(self.folder, 'journal.jsonl')
+        # the first scheduled report fails, the second one is running
+        # until the failure is journaled, and the rest never start
+        order = list(core.scheduler.schedule(self.report.estimate_costs()))
+        self.first, self.second = order[:2]
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def releasing_journal(self, release):
+        record = core.journal.Journal.record
+
+        def releasing_record(journal, key, filename, status, error=None):
+            record(journal, key, filename, status, error=error)
+            if status == core.journal.Journal.FAILED:
+                release.set()
+
+        return mock.patch.object(core.journal.Journal, 'record', releasing_record)
+
+    def check_outcome(self):
+        journal = core.journal.Journal(self.journal)
+        nt.assert_set_equal(set(journal.entries.keys()), {self.first, self.second})
+        nt.assert_list_equal(list(journal.failed().keys()), [self.first])
+        nt.assert_set_equal(journal.completed(), {self.second})
+        nt.assert_set_equal(journal.skipped(), set())
+
+        written = set(f for f in os.listdir(self.folder) if f.endswith('.pdf'))
+        nt.assert_set_equal(
+            written, {os.path.basename(journal.entries[self.second]['filename'])})
+
+    def test_threads(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fake_export(key, loc, filename, statplot_options, timings=None):
+            calls.append(key)
+            return blocking_converter('', filename, first=self.first[0],
+                                      started=started, release=release)
+
+        self.report._export_pdf = fake_export
+        with self.releasing_journal(release):
+            nt.assert_raises(OSError, self.report.export_pdfs, self.folder,
+                             max_workers=2, journal=self.journal)
+
+        nt.assert_set_equal(set(calls), {self.first, self.second})
+        self.check_outcome()
+
+    @nptest.dec.skipif(core.shared.shared_memory is None)
+    def test_processes(self):
+        with multiprocessing.Manager() as manager:
+            release = manager.Event()
+            self.report.converter = functools.partial(
+                blocking_converter, first=self.first[0],
+                started=manager.Event(), release=release)
+            with self.releasing_journal(release):
+                nt.assert_raises(OSError, self.report.export_pdfs, self.folder,
+                                 max_workers=2, processes=True, journal=self.journal)
+
+        self.check_outcome()
+
+
 class test_PdfReport_defaults(Base_PdfReport_Mixin):
     def setup(self):
         from numpy import nan
@@ -0,0 +1,64 @@
+import io
+
+import nose.tools as nt
+
+from wqreports.core import scheduler
+
+
+def test_estimate_cost_too_small():
+    nt.assert_equal(scheduler.estimate_cost(2, bsIter=5000), 0)
+
+
+def test_estimate_cost_scales():
+    small = scheduler.estimate_cost(10, bsIter=5000)
+    nt.assert_greater(scheduler.estimate_cost(100, bsIter=5000), small)
+    nt.assert_greater(scheduler.estimate_cost(10, bsIter=10000), small)
+
+
+def test_estimate_cost_ROS():
+    base = scheduler.estimate_cost(50, ND=10, bsIter=5000, useROS=False)
+    nt.assert_greater(scheduler.estimate_cost(50, ND=10, bsIter=5000, useROS=True), base)
+    nt.assert_equal(scheduler.estimate_cost(50, ND=0, bsIter=5000, useROS=True), base)
+
+
+def test_estimate_cost_analytic():
+    full = scheduler.estimate_cost(50, bsIter=5000)
+    nt.assert_less(scheduler.estimate_cost(50, bsIter=5000, bootstrapped=1), full)
+    nt.assert_less(scheduler.estimate_cost(50, bsIter=5000, bootstrapped=0), full / 100)
+
+
+def test_schedule():
+    costs = {'a': 1.0, 'b': 10.0, 'c': 5.0, 'd': 5.0}
+    nt.assert_list_equal(scheduler.schedule(costs), ['b', 'c', 'd', 'a'])
+
+
+class test_Progress(object):
+    def setup(self):
+        self.costs = {'a': 300.0, 'b': 200.0, 'c': 100.0}
+        self.stream = io.StringIO()
+        self.progress = scheduler.Progress(self.costs, stream=self.stream)
+
+    def test_eta_before_start(self):
+        nt.assert_true(self.progress.eta is None)
+
+    def test_eta_calibrated(self):
+        # 0.01 s per unit of cost, plus 2 s of plotting and PDF per report
+        self.progress.update('a', {'stats': 3.0, 'plot': 1.5, 'pdf': 0.5})
+        nt.assert_almost_equal(self.progress.eta, 3.0 + 2 * 2.0)
+
+    def test_eta_workers(self):
+        progress = scheduler.Progress(self.costs, workers=2, stream=None)
+        progress.update('a', {'stats': 3.0, 'plot': 1.5, 'pdf': 0.5})
+        nt.assert_almost_equal(progress.eta, (3.0 + 2 * 2.0) / 2)
+
+    def test_failed_job(self):
+        self.progress.update('a')
+        nt.assert_equal(self.progress.completed, 1)
+        nt.assert_almost_equal(self.progress.remaining_cost, 300.0)
+
+    def test_done(self):
+        for key in ['a', 'b', 'c']:
+            self.progress.update(key, {'stats': 1.0, 'plot': 1.0, 'pdf': 1.0})
+        nt.assert_almost_equal(self.progress.eta, 0)
+        nt.assert_true(self.stream.getvalue().splitlines()[-1].startswith(
+            'Completed 3 of 3 reports'))
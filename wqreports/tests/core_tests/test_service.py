@@ -0,0 +1,121 @@
+import os
+import shutil
+import tempfile
+import threading
+from urllib.request import urlopen
+from urllib.error import HTTPError
+from pkg_resources import resource_filename
+
+import nose.tools as nt
+
+from wqreports.core import service
+from wqreports.testing import stub_converter
+
+
+class test_LRUCache(object):
+    def setup(self):
+        self.cache = service.LRUCache(maxsize=2)
+
+    def test_get_missing(self):
+        nt.assert_true(self.cache.get('a') is None)
+        nt.assert_equal(self.cache.get('a', 1), 1)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.get('a')
+        self.cache.put('c', 3)
+        nt.assert_true('a' in self.cache)
+        nt.assert_false('b' in self.cache)
+        nt.assert_true('c' in self.cache)
+        nt.assert_equal(len(self.cache), 2)
+
+    def test_clear(self):
+        self.cache.put('a', 1)
+        self.cache.clear()
+        nt.assert_equal(len(self.cache), 0)
+
+
+class test_ReportService(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'data.csv')
+        shutil.copy(resource_filename("wqreports.testing", "testdata.txt"), self.path)
+
+        self.calls = []
+        def recording_converter(html, savename, css=None):
+            self.calls.append(savename)
+            return stub_converter(html, savename, css=css)
+
+        self.service = service.ReportService(self.path, maxsize=4, bsIter=500,
+                                             converter=recording_converter)
+        self.server = service.make_server(self.service, port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+
+    def teardown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.folder)
+
+    def test_render_cached(self):
+        pdf = self.service.render('location1', 'analyte_a')
+        nt.assert_true(b'analyte_a' in pdf)
+        nt.assert_true(self.service.render('location1', 'analyte_a') is pdf)
+        nt.assert_equal(len(self.calls), 1)
+
+    @nt.raises(service.UnknownGroup)
+    def test_render_missing(self):
+        self.service.render('location1', 'JUNK')
+
+    def test_invalidated_on_change(self):
+        report = self.service.report
+        self.service.render('location1', 'analyte_a')
+        with open(self.path, 'a') as data:
+            data.write('location1,analyte_a,0.5,,mg/L,0.8\n')
+        os.utime(self.path, (0, 0))
+
+        nt.assert_true(self.service.report is not report)
+        nt.assert_equal(len(self.service.cache), 0)
+        self.service.render('location1', 'analyte_a')
+        nt.assert_equal(len(self.calls), 2)
+
+    def test_http_report(self):
+        response = urlopen(self.url + '/report?geolocation=location1&analyte=analyte_b')
+        nt.assert_equal(response.status, 200)
+        nt.assert_equal(response.headers['Content-Type'], 'application/pdf')
+        nt.assert_true(b'analyte_b' in response.read())
+
+    def test_http_errors(self):
+        for query, status in [('/report?geolocation=location1', 400),
+                              ('/report?geolocation=location1&analyte=JUNK', 404),
+                              ('/other', 404)]:
+            with nt.assert_raises(HTTPError) as context:
+                urlopen(self.url + query)
+            nt.assert_equal(context.exception.code, status)
+
+    def test_http_server_error(self):
+        def failing_converter(html, savename, css=None):
+            raise RuntimeError('wkhtmltopdf crashed')
+
+        self.service.report.converter = failing_converter
+        with nt.assert_raises(HTTPError) as context:
+            urlopen(self.url + '/report?geolocation=location1&analyte=analyte_a')
+        nt.assert_equal(context.exception.code, 500)
+
+        # the server is still up
+        self.service.report.converter = stub_converter
+        response = urlopen(self.url + '/report?geolocation=location1&analyte=analyte_a')
+        nt.assert_equal(response.status, 200)
+
+    def test_http_internal_key_error(self):
+        # only an unknown group is a 404, not a KeyError while rendering
+        def failing_export(key, loc, filename, statplot_options, timings=None):
+            raise KeyError('statplot')
+
+        self.service.report._export_pdf = failing_export
+        with nt.assert_raises(HTTPError) as context:
+            urlopen(self.url + '/report?geolocation=location1&analyte=analyte_a')
+        nt.assert_equal(context.exception.code, 500)
@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+from unittest import mock, SkipTest
+from pkg_resources import resource_filename
+
+import nose.tools as nt
+import numpy as np
+import pandas
+import pandas.util.testing as pdtest
+
+from wqreports import core
+from wqreports.core import shared
+from wqreports.core.groups import GroupIndex
+from wqreports.testing import stub_converter
+
+
+def skip_without_shared_memory():
+    # numpy's skipif decorates functions, not classes
+    if shared.shared_memory is None:
+        raise SkipTest('multiprocessing.shared_memory is not available')
+
+
+class test_SharedDataset(object):
+    def setup(self):
+        skip_without_shared_memory()
+        self.data = pandas.DataFrame({
+            'location': ['B', 'A', 'B', 'A', 'A', 'B', None, 'A'],
+            'season': ['summer', 'winter', 'winter', 'summer', 'winter', 'summer', 'winter', 'summer'],
+            'analyte': ['x', 'x', 'y', 'y', 'x', 'x', 'x', 'y'],
+            'res': np.arange(8, dtype=float),
+            'count': np.arange(8, dtype=int),
+        })
+        self.index = GroupIndex(self.data, ['location', 'analyte', 'season'])
+        self.groupings = [['location', 'analyte'], ['analyte', 'season']]
+        self.published = shared.SharedDataset.publish(self.index, self.groupings)
+
+    def teardown(self):
+        self.published.close()
+
+    def check_groups(self, dataset, columns):
+        known = self.index.groups(columns)
+        groups = dataset.groups(columns)
+        nt.assert_list_equal(list(groups.keys()), list(known.keys()))
+        for key, rows in groups.items():
+            frame = dataset.frame(rows)
+            expected = self.index.frame(known[key]).reset_index(drop=True)
+            pdtest.assert_frame_equal(frame.astype(expected.dtypes.to_dict()), expected)
+
+    def test_contiguous_groups(self):
+        self.check_groups(self.published, ['location', 'analyte'])
+
+    def test_positional_groups(self):
+        self.check_groups(self.published, ['analyte', 'season'])
+
+    def test_attach(self):
+        attached = shared.SharedDataset.attach(self.published.handle)
+        try:
+            self.check_groups(attached, ['location', 'analyte'])
+            self.check_groups(attached, ['analyte', 'season'])
+        finally:
+            attached.close()
+
+    def test_attach_does_not_copy(self):
+        attached = shared.SharedDataset.attach(self.published.handle)
+        try:
+            self.published.arrays['res'][0] = -1.0
+            nt.assert_equal(attached.arrays['res'][0], -1.0)
+        finally:
+            attached.close()
+
+    @nt.raises(ValueError)
+    def test_unpublished_groups(self):
+        self.published.groups(['location', 'season'])
+
+    def test_close_unlinks(self):
+        handle = self.published.handle
+        self.published.close()
+        nt.assert_raises(FileNotFoundError, shared.SharedDataset.attach, handle)
+
+
+class test_export_pdfs_processes(object):
+    def setup(self):
+        skip_without_shared_memory()
+        self.folder = tempfile.mkdtemp()
+        self.path = resource_filename("wqreports.testing", "testdata.txt")
+        self.report = core.PdfReport(self.path, bsIter=500, ciMethods='analytic',
+                                     converter=stub_converter)
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_export(self):
+        failed = self.report.export_pdfs(self.folder, max_workers=2, processes=True)
+        nt.assert_dict_equal(failed, {})
+
+        journal = core.journal.Journal(os.path.join(self.folder, 'wqreports_journal.jsonl'))
+        completed = journal.completed()
+        nt.assert_set_equal(completed, set(self.report.estimate_costs().keys()))
+        for filename in os.listdir(self.folder):
+            if filename.endswith('.pdf'):
+                with open(os.path.join(self.folder, filename)) as output:
+                    nt.assert_true(len(output.read()) > 0)
+
+    def test_default_workers(self):
+        with mock.patch.object(core.pdfreport.PdfReport, '_export_processes',
+                               return_value=[]) as export:
+            self.report.export_pdfs(self.folder, processes=True)
+        nt.assert_equal(export.call_args[0][-1], os.cpu_count() or 1)